@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmark - search and design-system generation performance
+
+Usage: python bench_search.py [--scales 1 10 100] [--repeat 5] [--output bench.json]
+       python bench_search.py --compare previous.json [--output bench.json]
+
+For every scale, each CSV is replicated that many times into a temporary
+data directory. The harness then measures:
+  - index build time per domain/stack (cold: no memory or disk index)
+  - p50/p99 latency of a fixed query corpus covering every domain and stack
+  - p50/p99 latency of generate_design_system
+  - peak RSS of the process so far (monotonic, so read it per scale in order)
+
+The JSON report can be fed back with --compare to print ratios against a
+previous run.
+"""
+
+import argparse
+import csv
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import core
+import design_system
+from core import CSV_CONFIG, STACK_CONFIG, _STACK_COLS
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# ============ CONFIGURATION ============
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_REPEAT = 5
+
+DOMAIN_QUERIES = {
+    "style": ["glassmorphism dark mode", "minimalism clean whitespace", "brutalism bold"],
+    "color": ["saas professional blue", "healthcare calm", "fintech trust"],
+    "chart": ["real-time trend dashboard", "comparison bar", "funnel conversion"],
+    "landing": ["hero social proof pricing", "testimonial cta", "waitlist launch"],
+    "product": ["saas dashboard", "ecommerce luxury", "beauty spa wellness"],
+    "ux": ["animation accessibility", "touch target mobile", "loading skeleton"],
+    "typography": ["elegant luxury serif", "playful rounded", "modern geometric sans"],
+    "icons": ["navigation menu", "social share", "settings gear"],
+    "react": ["waterfall suspense", "bundle barrel import", "memo rerender"],
+    "web": ["aria focus keyboard", "form autocomplete input", "virtualize long list"],
+}
+STACK_QUERIES = ["layout responsive form", "state performance", "accessibility focus"]
+DESIGN_SYSTEM_QUERIES = ["saas dashboard", "beauty spa wellness service", "fintech crypto", "ecommerce luxury fashion"]
+
+
+# ============ HELPERS ============
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(1, min(len(ordered), round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def summarize(samples):
+    """Latency summary in milliseconds"""
+    return {
+        "n": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 4),
+        "p99_ms": round(percentile(samples, 99) * 1000, 4),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 4) if samples else 0.0,
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def build_scaled_data(source_dir, target_dir, scale):
+    """Copy every CSV into target_dir with each data row repeated `scale` times"""
+    for source in source_dir.rglob("*.csv"):
+        target = target_dir / source.relative_to(source_dir)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(source, "r", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        header, body = rows[0], rows[1:]
+        with open(target, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for _ in range(scale):
+                writer.writerows(body)
+
+
+def reset_caches():
+    core._INDEX_CACHE.clear()
+    core.clear_table_cache()
+    core.DEFAULT_TOKENIZER.tokenize_query.cache_clear()
+
+
+def targets():
+    """(label, csv path relative to DATA_DIR, search cols) for every domain and stack"""
+    items = [(f"domain:{name}", config["file"], config["search_cols"]) for name, config in CSV_CONFIG.items()]
+    items += [(f"stack:{name}", config["file"], _STACK_COLS["search_cols"]) for name, config in STACK_CONFIG.items()]
+    return items
+
+
+def time_call(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+# ============ BENCHMARK ============
+def bench_scale(data_dir, scale, repeat):
+    """Measure one scale with core and design_system pointed at data_dir"""
+    core.DATA_DIR = data_dir
+    design_system.DATA_DIR = data_dir
+    reset_caches()
+
+    rows = 0
+    build = {}
+    for label, relative, search_cols in targets():
+        filepath = data_dir / relative
+        rows += len(core.load_csv(filepath))
+        build[label] = round(time_call(core.get_index, filepath, search_cols) * 1000, 3)
+
+    # Persisted-index load: memory cache dropped, disk index present
+    core._INDEX_CACHE.clear()
+    load_ms = {
+        label: round(time_call(core.get_index, data_dir / relative, search_cols) * 1000, 3)
+        for label, relative, search_cols in targets()
+    }
+
+    search_samples = []
+    per_domain = {}
+    for _ in range(repeat):
+        core.DEFAULT_TOKENIZER.tokenize_query.cache_clear()
+        for domain, queries in DOMAIN_QUERIES.items():
+            for query in queries:
+                elapsed = time_call(core.search, query, domain)
+                search_samples.append(elapsed)
+                per_domain.setdefault(f"domain:{domain}", []).append(elapsed)
+        for stack in STACK_CONFIG:
+            for query in STACK_QUERIES:
+                elapsed = time_call(core.search_stack, query, stack)
+                search_samples.append(elapsed)
+                per_domain.setdefault(f"stack:{stack}", []).append(elapsed)
+
+    design_samples = [
+        time_call(design_system.generate_design_system, query)
+        for _ in range(repeat)
+        for query in DESIGN_SYSTEM_QUERIES
+    ]
+
+    return {
+        "scale": scale,
+        "rows": rows,
+        "index_build_ms": {"total": round(sum(build.values()), 3), "by_target": build},
+        "index_load_ms": {"total": round(sum(load_ms.values()), 3), "by_target": load_ms},
+        "search": summarize(search_samples),
+        "search_by_target": {label: summarize(samples) for label, samples in per_domain.items()},
+        "design_system": summarize(design_samples),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_benchmark(scales, repeat):
+    source_dir = core.DATA_DIR
+    results = []
+    try:
+        for scale in scales:
+            work_dir = Path(tempfile.mkdtemp(prefix=f"ui-pro-max-bench-{scale}x-"))
+            try:
+                build_scaled_data(source_dir, work_dir, scale)
+                results.append(bench_scale(work_dir, scale, repeat))
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+    finally:
+        core.DATA_DIR = source_dir
+        design_system.DATA_DIR = source_dir
+        reset_caches()
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "scales": results,
+    }
+
+
+# ============ REPORTING ============
+def format_report(report, baseline=None):
+    baseline_by_scale = {s["scale"]: s for s in (baseline or {}).get("scales", [])}
+
+    def ratio(current, previous):
+        if not previous:
+            return ""
+        return f" ({current / previous:.2f}x)"
+
+    lines = [f"UI Pro Max benchmark (python {report['python']}, repeat {report['repeat']})"]
+    for result in report["scales"]:
+        previous = baseline_by_scale.get(result["scale"], {})
+        build = result["index_build_ms"]["total"]
+        load = result["index_load_ms"]["total"]
+        search = result["search"]
+        design = result["design_system"]
+        lines.append(f"\n## {result['scale']}x ({result['rows']} rows)")
+        lines.append(f"  index build  {build:>10.1f} ms{ratio(build, previous.get('index_build_ms', {}).get('total'))}")
+        lines.append(f"  index load   {load:>10.1f} ms{ratio(load, previous.get('index_load_ms', {}).get('total'))}")
+        lines.append(f"  search p50   {search['p50_ms']:>10.3f} ms{ratio(search['p50_ms'], previous.get('search', {}).get('p50_ms'))}")
+        lines.append(f"  search p99   {search['p99_ms']:>10.3f} ms{ratio(search['p99_ms'], previous.get('search', {}).get('p99_ms'))}")
+        lines.append(f"  design p50   {design['p50_ms']:>10.3f} ms{ratio(design['p50_ms'], previous.get('design_system', {}).get('p50_ms'))}")
+        lines.append(f"  design p99   {design['p99_ms']:>10.3f} ms{ratio(design['p99_ms'], previous.get('design_system', {}).get('p99_ms'))}")
+        if result["peak_rss_mb"] is not None:
+            lines.append(f"  peak RSS     {result['peak_rss_mb']:>10.1f} MB")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search benchmark")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="Dataset multipliers (default: 1 10 100)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Repetitions of the query corpus (default: 5)")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write the JSON report to this path")
+    parser.add_argument("--compare", type=str, default=None, help="Previous JSON report to compare against")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    report = run_benchmark(sorted(args.scales), args.repeat)
+    print(format_report(report, baseline))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport saved to {args.output}")
@@ -5,15 +5,34 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
-import re
+import hashlib
+import heapq
+import json
+import os
+import sys
+import tempfile
+import threading
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+
+from tokenizer import DEFAULT_TOKENIZER
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
 MAX_RESULTS = 3
 
+# Prebuilt BM25 indexes live in a ".index" folder next to each CSV
+INDEX_DIR_NAME = ".index"
+INDEX_VERSION = 2
+
+# Parsed CSV tables shared by every search in the process (LRU bounded)
+TABLE_CACHE_MAX_ENTRIES = 64
+TABLE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Only short cells (categories, severities, platforms...) repeat often enough to be worth interning
+INTERN_MAX_LEN = 32
+
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
@@ -96,132 +115,502 @@ AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 class BM25:
     """BM25 ranking algorithm for text search"""
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, tokenizer=None):
         self.k1 = k1
         self.b = b
-        self.corpus = []
+        self.tokenizer = tokenizer or DEFAULT_TOKENIZER
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
-        self.doc_freqs = defaultdict(int)
+        self.postings = {}
+        self.doc_norms = []
         self.N = 0
 
     def tokenize(self, text):
         """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+        return self.tokenizer.tokenize(text)
 
     def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        """Build BM25 inverted index (postings with term frequencies) from documents"""
+        corpus = self.tokenizer.tokenize_many(documents)
+        self.N = len(corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.doc_lengths = [len(doc) for doc in corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
-
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
-
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
-
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
+        postings = defaultdict(list)
+        for idx, doc in enumerate(corpus):
             term_freqs = defaultdict(int)
             for word in doc:
                 term_freqs[word] += 1
+            for word, tf in term_freqs.items():
+                postings[word].append((idx, tf))
+        self.postings = dict(postings)
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+        for word, docs in self.postings.items():
+            freq = len(docs)
+            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
-            scores.append((idx, score))
+        self._compute_doc_norms()
+
+    def _compute_doc_norms(self):
+        """Precompute the per-document length normalisation term of the BM25 denominator"""
+        avgdl = self.avgdl or 1
+        self.doc_norms = [self.k1 * (1 - self.b + self.b * doc_len / avgdl) for doc_len in self.doc_lengths]
+
+    def _term_contributions(self, token):
+        """(doc index, BM25 contribution) for every document in a token's postings"""
+        docs = self.postings.get(token)
+        if docs is None:
+            return ()
+        idf = self.idf[token]
+        k1_plus_1 = self.k1 + 1
+        return [(idx, idf * (tf * k1_plus_1) / (tf + self.doc_norms[idx])) for idx, tf in docs]
+
+    def _accumulate(self, query, contributions=None):
+        """Accumulate scores only for documents in the postings of query tokens
+
+        `contributions` memoizes per-token postings scores across queries so a
+        batch walks each distinct token's postings once.
+        """
+        if contributions is None:
+            contributions = {}
+        scores = defaultdict(float)
+        for token in self.tokenizer.tokenize_query(query):
+            term_scores = contributions.get(token)
+            if term_scores is None:
+                term_scores = contributions[token] = self._term_contributions(token)
+            for idx, value in term_scores:
+                scores[idx] += value
+        return scores
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+    def score(self, query):
+        """Score documents matching the query, best first (unmatched documents are omitted)"""
+        scores = self._accumulate(query)
+        return sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+
+    def top_k(self, query, k):
+        """Return the k best (doc index, score) pairs without sorting every match"""
+        return self.top_k_many([query], k)[0]
+
+    def top_k_many(self, queries, k):
+        """top_k for many queries, sharing postings work between queries with common tokens"""
+        contributions = {}
+        ranked = []
+        for query in queries:
+            scores = self._accumulate(query, contributions)
+            # Ties keep document order, matching a stable sort of the full ranking
+            ranked.append(heapq.nlargest(k, scores.items(), key=lambda x: (x[1], -x[0])))
+        return ranked
+
+    def to_dict(self):
+        """Serialize the fitted index to a JSON-compatible dict"""
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "tokenizer": self.tokenizer.signature,
+            "N": self.N,
+            "avgdl": self.avgdl,
+            "doc_lengths": self.doc_lengths,
+            "idf": self.idf,
+            "postings": {word: [list(p) for p in docs] for word, docs in self.postings.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data, tokenizer=None):
+        """Restore a fitted index produced by to_dict (with the same tokenizer configuration)"""
+        bm25 = cls(k1=data["k1"], b=data["b"], tokenizer=tokenizer)
+        bm25.N = data["N"]
+        bm25.avgdl = data["avgdl"]
+        bm25.doc_lengths = data["doc_lengths"]
+        bm25.idf = data["idf"]
+        bm25.postings = {word: [tuple(p) for p in docs] for word, docs in data["postings"].items()}
+        bm25._compute_doc_norms()
+        return bm25
+
+
+# ============ INDEX PERSISTENCE ============
+# Process-wide cache: (csv path, search cols) -> (source signature, BM25)
+_INDEX_CACHE = {}
+
+
+def _source_signature(filepath):
+    """Cheap change detector for a CSV file (mtime + size)"""
+    stat = filepath.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _source_digest(filepath):
+    """Content hash used when mtime/size changed but content may not have"""
+    return hashlib.sha1(filepath.read_bytes()).hexdigest()
+
+
+def _index_path(filepath):
+    """Location of the persisted index for a CSV file"""
+    return filepath.parent / INDEX_DIR_NAME / f"{filepath.stem}.json"
+
+
+def _read_index(index_path):
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_index(index_path, payload):
+    """Atomically persist an index; silently skipped on read-only installs"""
+    tmp_name = None
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=index_path.parent,
+                                         prefix=f".{index_path.name}.", delete=False) as tmp:
+            tmp_name = tmp.name
+            json.dump(payload, tmp, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_name, index_path)
+        tmp_name = None
+    except OSError:
+        pass
+    finally:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def _build_documents(table, search_cols):
+    """Build searchable documents from search columns"""
+    columns = [table.column(col) for col in search_cols]
+    return [" ".join(values) for values in zip(*columns)] if columns else [""] * len(table)
+
+
+def get_index(filepath, search_cols, table=None):
+    """Return a fitted BM25 index for a CSV, reusing memory and on-disk copies
+
+    The persisted index is keyed by the CSV's mtime/size and sha1, so editing a
+    CSV (or touching it without changes) is detected without re-tokenizing.
+    """
+    filepath = Path(filepath)
+    cache_key = (str(filepath), tuple(search_cols))
+    signature = _source_signature(filepath)
+
+    cached = _INDEX_CACHE.get(cache_key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    index_path = _index_path(filepath)
+    stored = _read_index(index_path)
+    if (stored and stored.get("version") == INDEX_VERSION and stored.get("search_cols") == list(search_cols)
+            and stored["index"].get("tokenizer") == DEFAULT_TOKENIZER.signature):
+        source = stored.get("source", {})
+        fresh = (source.get("mtime_ns"), source.get("size")) == signature
+        if not fresh and source.get("sha1") == _source_digest(filepath):
+            fresh = True
+            source["mtime_ns"], source["size"] = signature
+            _write_index(index_path, stored)
+        if fresh:
+            bm25 = BM25.from_dict(stored["index"])
+            _INDEX_CACHE[cache_key] = (signature, bm25)
+            return bm25
+
+    if table is None:
+        table = load_csv(filepath)
+    bm25 = BM25()
+    bm25.fit(_build_documents(table, search_cols))
+    _write_index(index_path, {
+        "version": INDEX_VERSION,
+        "search_cols": list(search_cols),
+        "source": {"mtime_ns": signature[0], "size": signature[1], "sha1": _source_digest(filepath)},
+        "index": bm25.to_dict(),
+    })
+    _INDEX_CACHE[cache_key] = (signature, bm25)
+    return bm25
+
+
+def warm_indexes():
+    """Load every domain and stack index into memory, returns how many were loaded"""
+    targets = [(DATA_DIR / config["file"], config["search_cols"]) for config in CSV_CONFIG.values()]
+    targets += [(DATA_DIR / config["file"], _STACK_COLS["search_cols"]) for config in STACK_CONFIG.values()]
+    loaded = 0
+    for filepath, search_cols in targets:
+        if filepath.exists():
+            get_index(filepath, search_cols)
+            loaded += 1
+    return loaded
+
+
+# ============ COLUMNAR TABLE ============
+class Table:
+    """Column-oriented CSV table: column name -> list of (short values interned) strings, rows are integer ids"""
+
+    __slots__ = ("fieldnames", "columns", "n_rows")
+
+    def __init__(self, fieldnames, columns, n_rows):
+        self.fieldnames = fieldnames
+        self.columns = columns
+        self.n_rows = n_rows
+
+    @classmethod
+    def from_csv(cls, f):
+        """Parse an open CSV file; short rows are padded with empty strings"""
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        width = len(fieldnames)
+        values = [[] for _ in fieldnames]
+        n_rows = 0
+        for record in reader:
+            if not record:
+                continue
+            record += [""] * (width - len(record))
+            for col_values, value in zip(values, record):
+                col_values.append(sys.intern(value) if len(value) <= INTERN_MAX_LEN else value)
+            n_rows += 1
+        return cls(fieldnames, dict(zip(fieldnames, values)), n_rows)
+
+    def __len__(self):
+        return self.n_rows
+
+    def __contains__(self, col):
+        return col in self.columns
+
+    def column(self, col):
+        """All values of a column ("" for every row if the column is absent)"""
+        values = self.columns.get(col)
+        return values if values is not None else [""] * self.n_rows
+
+    def get(self, row_id, col, default=""):
+        """Single cell lookup"""
+        values = self.columns.get(col)
+        return values[row_id] if values is not None else default
+
+    def project(self, row_id, cols):
+        """Materialise one row as a dict restricted to the given (present) columns"""
+        return {col: self.columns[col][row_id] for col in cols if col in self.columns}
+
+    def row(self, row_id):
+        """Materialise one full row as a dict"""
+        return self.project(row_id, self.fieldnames)
+
+
+# ============ TABLE CACHE ============
+# path -> (source signature, table, size in bytes), least recently used first
+_TABLE_CACHE = OrderedDict()
+_TABLE_CACHE_LOCK = threading.Lock()
+_TABLE_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def load_csv(filepath):
+    """Load CSV as a columnar Table, memoized by path + mtime + size
+
+    The returned table is shared between callers and must be treated as read-only.
+    """
+    filepath = Path(filepath)
+    key = str(filepath)
+    signature = _source_signature(filepath)
+
+    with _TABLE_CACHE_LOCK:
+        cached = _TABLE_CACHE.get(key)
+        if cached and cached[0] == signature:
+            _TABLE_CACHE.move_to_end(key)
+            _TABLE_CACHE_STATS["hits"] += 1
+            return cached[1]
+        _TABLE_CACHE_STATS["misses"] += 1
+
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        table = Table.from_csv(f)
+
+    with _TABLE_CACHE_LOCK:
+        _TABLE_CACHE[key] = (signature, table, signature[1])
+        _TABLE_CACHE.move_to_end(key)
+        total_bytes = sum(entry[2] for entry in _TABLE_CACHE.values())
+        while len(_TABLE_CACHE) > 1 and (len(_TABLE_CACHE) > TABLE_CACHE_MAX_ENTRIES or total_bytes > TABLE_CACHE_MAX_BYTES):
+            _, evicted = _TABLE_CACHE.popitem(last=False)
+            total_bytes -= evicted[2]
+            _TABLE_CACHE_STATS["evictions"] += 1
+    return table
+
+
+def table_cache_stats():
+    """Hits, misses, evictions, resident tables and their source bytes"""
+    with _TABLE_CACHE_LOCK:
+        return {
+            **_TABLE_CACHE_STATS,
+            "entries": len(_TABLE_CACHE),
+            "bytes": sum(entry[2] for entry in _TABLE_CACHE.values()),
+        }
+
+
+def clear_table_cache():
+    """Drop every cached table and reset the stats"""
+    with _TABLE_CACHE_LOCK:
+        _TABLE_CACHE.clear()
+        for name in _TABLE_CACHE_STATS:
+            _TABLE_CACHE_STATS[name] = 0
 
 
 # ============ SEARCH FUNCTIONS ============
-def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
-
 
 def _search_csv(filepath, search_cols, output_cols, query, max_results):
     """Core search function using BM25"""
-    if not filepath.exists():
-        return []
+    return _search_csv_many(filepath, search_cols, output_cols, [query], max_results)[0]
 
-    data = _load_csv(filepath)
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+def _search_csv_many(filepath, search_cols, output_cols, queries, max_results):
+    """Search one CSV for many queries with a single table/index lookup"""
+    if not filepath.exists():
+        return [[] for _ in queries]
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+    table = load_csv(filepath)
+
+    # BM25 search over the prebuilt index
+    bm25 = get_index(filepath, search_cols, table)
 
     # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
-
-    return results
-
-
-def detect_domain(query):
-    """Auto-detect the most relevant domain from query"""
-    query_lower = query.lower()
-
-    domain_keywords = {
-        "color": ["color", "palette", "hex", "#", "rgb"],
-        "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
-        "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
-        "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
-        "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora", "prompt", "css", "implementation", "variable", "checklist", "tailwind"],
-        "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
-        "typography": ["font", "typography", "heading", "serif", "sans"],
-        "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
-        "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
-        "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
-    }
+    return [
+        [table.project(idx, output_cols) for idx, score in ranked if score > 0]
+        for ranked in bm25.top_k_many(queries, max_results)
+    ]
+
+
+# ============ DOMAIN DETECTION ============
+DOMAIN_KEYWORDS = {
+    "color": ["color", "palette", "hex", "#", "rgb"],
+    "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
+    "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
+    "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
+    "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora", "prompt", "css", "implementation", "variable", "checklist", "tailwind"],
+    "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
+    "typography": ["font", "typography", "heading", "serif", "sans"],
+    "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
+    "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
+    "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
+}
 
-    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
+DETECT_CACHE_SIZE = 4096
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton: reports every keyword occurring in a text in a single pass"""
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keywords))
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (keyword_id,)
+
+        # Breadth-first failure links; each state inherits the outputs of its fallback
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find(self, text):
+        """Set of keywords that occur as substrings of text"""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for keyword_id in self._output[state]:
+                found.add(self.keywords[keyword_id])
+        return found
+
+
+def _keyword_domains():
+    """keyword -> domains listing it"""
+    mapping = defaultdict(list)
+    for domain, keywords in DOMAIN_KEYWORDS.items():
+        for keyword in keywords:
+            mapping[keyword].append(domain)
+    return dict(mapping)
+
+
+_KEYWORD_DOMAINS = _keyword_domains()
+_DOMAIN_AUTOMATON = KeywordAutomaton(_KEYWORD_DOMAINS)
+
+
+def _domain_corpus_signature():
+    """Source signatures of every domain CSV, used to invalidate derived keyword weights"""
+    return tuple(
+        _source_signature(DATA_DIR / config["file"]) if (DATA_DIR / config["file"]).exists() else None
+        for config in CSV_CONFIG.values()
+    )
+
+
+@lru_cache(maxsize=4)
+def _domain_keyword_weights(corpus_signature):
+    """Weight each domain keyword by how distinctive it is across the domain corpora
+
+    A keyword whose tokens occur in its domain's own CSV gets 1 + log(1 + D / d),
+    where D is the number of domain corpora and d how many of them contain it;
+    other keywords keep weight 1.
+    """
+    vocabularies = {}
+    for domain, config in CSV_CONFIG.items():
+        filepath = DATA_DIR / config["file"]
+        vocabularies[domain] = set(get_index(filepath, config["search_cols"]).postings) if filepath.exists() else set()
+
+    def occurs(keyword, vocabulary):
+        tokens = DEFAULT_TOKENIZER.tokenize(keyword)
+        return bool(tokens) and all(token in vocabulary for token in tokens)
+
+    n_corpora = len(vocabularies)
+    weights = {}
+    for domain, keywords in DOMAIN_KEYWORDS.items():
+        for keyword in keywords:
+            weight = 1.0
+            if occurs(keyword, vocabularies.get(domain, ())):
+                containing = sum(1 for vocabulary in vocabularies.values() if occurs(keyword, vocabulary))
+                weight += log(1 + n_corpora / containing)
+            weights[(domain, keyword)] = weight
+    return weights
+
+
+@lru_cache(maxsize=DETECT_CACHE_SIZE)
+def _detect_domain_cached(query_lower, corpus_signature):
+    weights = _domain_keyword_weights(corpus_signature) if corpus_signature is not None else None
+    scores = dict.fromkeys(DOMAIN_KEYWORDS, 0)
+    for keyword in _DOMAIN_AUTOMATON.find(query_lower):
+        for domain in _KEYWORD_DOMAINS[keyword]:
+            scores[domain] += weights[(domain, keyword)] if weights else 1
     best = max(scores, key=scores.get)
     return best if scores[best] > 0 else "style"
 
 
-def search(query, domain=None, max_results=MAX_RESULTS):
-    """Main search function with auto-domain detection"""
-    if domain is None:
-        domain = detect_domain(query)
-
-    config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
-    filepath = DATA_DIR / config["file"]
+def detect_domain(query, weighted=False):
+    """Auto-detect the most relevant domain from query
 
-    if not filepath.exists():
-        return {"error": f"File not found: {filepath}", "domain": domain}
+    Keywords are matched in one pass by an Aho-Corasick automaton and results
+    are cached per query. With weighted=True, keyword votes are weighted by
+    their distinctiveness in the domain CSVs (see _domain_keyword_weights).
+    """
+    corpus_signature = _domain_corpus_signature() if weighted else None
+    return _detect_domain_cached(query.lower(), corpus_signature)
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
 
+def _domain_result(domain, query, results):
+    config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
     return {
         "domain": domain,
         "query": query,
@@ -231,18 +620,7 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     }
 
 
-def search_stack(query, stack, max_results=MAX_RESULTS):
-    """Search stack-specific guidelines"""
-    if stack not in STACK_CONFIG:
-        return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
-
-    filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
-
-    if not filepath.exists():
-        return {"error": f"Stack file not found: {filepath}", "stack": stack}
-
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
-
+def _stack_result(stack, query, results):
     return {
         "domain": "stack",
         "stack": stack,
@@ -251,3 +629,57 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def search(query, domain=None, max_results=MAX_RESULTS):
+    """Main search function with auto-domain detection"""
+    return search_many([query], domain, max_results)[0]
+
+
+def search_many(queries, domain=None, max_results=MAX_RESULTS):
+    """Search many queries, scoring each domain's queries in one pass over its index
+
+    Without a domain, each query is routed by detect_domain. Results are
+    returned in input order with the same shape as search().
+    """
+    queries = list(queries)
+    by_domain = defaultdict(list)
+    for position, query in enumerate(queries):
+        by_domain[domain if domain is not None else detect_domain(query)].append(position)
+
+    output = [None] * len(queries)
+    for query_domain, positions in by_domain.items():
+        config = CSV_CONFIG.get(query_domain, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+
+        if not filepath.exists():
+            for position in positions:
+                output[position] = {"error": f"File not found: {filepath}", "domain": query_domain}
+            continue
+
+        domain_queries = [queries[position] for position in positions]
+        results = _search_csv_many(filepath, config["search_cols"], config["output_cols"], domain_queries, max_results)
+        for position, query, query_results in zip(positions, domain_queries, results):
+            output[position] = _domain_result(query_domain, query, query_results)
+
+    return output
+
+
+def search_stack(query, stack, max_results=MAX_RESULTS):
+    """Search stack-specific guidelines"""
+    return search_stack_many([query], stack, max_results)[0]
+
+
+def search_stack_many(queries, stack, max_results=MAX_RESULTS):
+    """Search many queries against one stack in a single pass"""
+    queries = list(queries)
+    if stack not in STACK_CONFIG:
+        return [{"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"} for _ in queries]
+
+    filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
+
+    if not filepath.exists():
+        return [{"error": f"Stack file not found: {filepath}", "stack": stack} for _ in queries]
+
+    results = _search_csv_many(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], queries, max_results)
+    return [_stack_result(stack, query, query_results) for query, query_results in zip(queries, results)]
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Daemon - keeps BM25 indexes warm and answers search requests
+over a Unix domain socket.
+
+Usage:
+    python search.py --serve [--socket /path/to.sock]
+
+    from daemon import call
+    result = call("search", {"query": "saas dashboard", "domain": "style"})
+
+Protocol: one JSON object per line in each direction.
+    request:  {"op": "search" | "search_many" | "search_stack" | "search_stack_many"
+                     | "generate_design_system" | "cache_stats", "args": {...}}
+    response: {"ok": true, "result": ...} or {"ok": false, "error": "..."}
+
+`call` falls back to in-process execution when no daemon is listening, so
+callers never need to know whether one is running. A request the daemon
+has accepted is never re-run in-process.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+from pathlib import Path
+
+from core import search, search_many, search_stack, search_stack_many, table_cache_stats, warm_indexes
+from design_system import generate_design_system
+
+
+# ============ CONFIGURATION ============
+SOCKET_ENV = "UI_PRO_MAX_SOCKET"
+CONNECT_TIMEOUT = 0.5
+REQUEST_TIMEOUT = 30
+
+OPERATIONS = {
+    "search": search,
+    "search_many": search_many,
+    "search_stack": search_stack,
+    "search_stack_many": search_stack_many,
+    "generate_design_system": generate_design_system,
+    "cache_stats": table_cache_stats,
+}
+
+
+def default_socket_path() -> Path:
+    """Socket path from $UI_PRO_MAX_SOCKET, else a per-user file in the temp dir."""
+    env_path = os.environ.get(SOCKET_ENV)
+    if env_path:
+        return Path(env_path)
+    uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return Path(tempfile.gettempdir()) / f"ui-ux-pro-max-{uid}.sock"
+
+
+def dispatch(op: str, args: dict):
+    """Run an operation in the current process."""
+    if op not in OPERATIONS:
+        raise ValueError(f"Unknown operation: {op}. Available: {', '.join(OPERATIONS)}")
+    return OPERATIONS[op](**args)
+
+
+# ============ SERVER ============
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers newline-delimited JSON requests until the client disconnects."""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                response = {"ok": True, "result": dispatch(request["op"], request.get("args", {}))}
+            except Exception as exc:  # Report every failure to the client, keep serving
+                response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _SearchServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _socket_is_live(socket_path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve(socket_path=None) -> None:
+    """Warm every domain and stack index, then serve requests until interrupted."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Unix domain sockets are not supported on this platform")
+
+    socket_path = Path(socket_path) if socket_path else default_socket_path()
+    if socket_path.exists():
+        if _socket_is_live(socket_path):
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+        socket_path.unlink()  # Stale socket left by a crashed daemon
+
+    warmed = warm_indexes()
+    server = _SearchServer(str(socket_path), _RequestHandler)
+    os.chmod(socket_path, 0o600)
+    signal.signal(signal.SIGTERM, _interrupt)
+    print(f"UI Pro Max daemon listening on {socket_path} ({warmed} indexes warm)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            socket_path.unlink()
+        except OSError:
+            pass
+
+
+# ============ CLIENT ============
+def _connect(socket_path: Path) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(socket_path))
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _request(sock: socket.socket, op: str, args: dict):
+    with sock:
+        sock.settimeout(REQUEST_TIMEOUT)
+        sock.sendall(json.dumps({"op": op, "args": args}, ensure_ascii=False).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError("Daemon closed the connection without a response")
+    return json.loads(line)
+
+
+def call(op: str, args: dict, socket_path=None):
+    """Run an operation on the daemon, falling back to in-process execution.
+
+    Only a failed connect (no daemon listening, stale or unusable socket
+    path) triggers the fallback; nothing has been sent at that point. Once the request is sent the daemon may already be doing
+    the work, so a timeout or broken reply raises RuntimeError instead of
+    running the operation a second time; so do errors raised by the
+    operation itself.
+    """
+    if hasattr(socket, "AF_UNIX"):
+        path = Path(socket_path) if socket_path else default_socket_path()
+        try:
+            sock = _connect(path)
+        except OSError:
+            sock = None
+        if sock is not None:
+            try:
+                response = _request(sock, op, args)
+            except (OSError, ValueError) as exc:
+                raise RuntimeError(f"Daemon request {op!r} failed after it was sent: {exc}") from exc
+            if not response.get("ok"):
+                raise RuntimeError(response.get("error", "Daemon request failed"))
+            return response["result"]
+    return dispatch(op, args)
@@ -13,12 +13,12 @@ Usage:
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
 """
 
-import csv
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, load_csv, Table, DATA_DIR
 
 
 # ============ CONFIGURATION ============
@@ -32,56 +32,92 @@ SEARCH_CONFIG = {
     "typography": {"max_results": 2}
 }
 
+# How independent domain searches are dispatched:
+#   "thread"     - thread pool sharing this process's warm indexes (default)
+#   "process"    - process pool, for cold indexes where building dominates
+#   "sequential" - one after another
+SEARCH_EXECUTORS = ("thread", "process", "sequential")
+DEFAULT_SEARCH_EXECUTOR = "thread"
+
+
+def run_searches(jobs: dict, executor: str = DEFAULT_SEARCH_EXECUTOR) -> dict:
+    """Run independent searches concurrently.
+
+    Args:
+        jobs: key -> (query, domain, max_results)
+        executor: one of SEARCH_EXECUTORS
+
+    Returns:
+        key -> search result, in the same order as jobs
+    """
+    if executor not in SEARCH_EXECUTORS:
+        raise ValueError(f"Unknown executor: {executor}. Available: {', '.join(SEARCH_EXECUTORS)}")
+    if executor == "sequential" or len(jobs) <= 1:
+        return {key: search(*args) for key, args in jobs.items()}
+
+    pool_cls = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    with pool_cls(max_workers=len(jobs)) as pool:
+        futures = {key: pool.submit(search, *args) for key, args in jobs.items()}
+        return {key: future.result() for key, future in futures.items()}
+
 
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
-    def __init__(self):
+    def __init__(self, executor: str = DEFAULT_SEARCH_EXECUTOR):
+        self.executor = executor
         self.reasoning_data = self._load_reasoning()
 
-    def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
+    def _load_reasoning(self) -> Table:
+        """Load reasoning rules from CSV (shared process-wide table cache)."""
         filepath = DATA_DIR / REASONING_FILE
         if not filepath.exists():
-            return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
+            return Table([], {}, 0)
+        return load_csv(filepath)
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
+    def _multi_domain_search(self, query: str, style_priority: list = None, known: dict = None) -> dict:
+        """Execute searches across multiple domains concurrently.
+
+        Results are returned in SEARCH_CONFIG order; domains already present
+        in `known` are reused instead of searched again.
+        """
+        known = known or {}
+        jobs = {}
         for domain, config in SEARCH_CONFIG.items():
+            if domain in known:
+                continue
             if domain == "style" and style_priority:
                 # For style, also search with priority keywords
                 priority_query = " ".join(style_priority[:2]) if style_priority else query
                 combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
+                jobs[domain] = (combined_query, domain, config["max_results"])
             else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
+                jobs[domain] = (query, domain, config["max_results"])
+
+        searched = run_searches(jobs, self.executor)
+        return {domain: known[domain] if domain in known else searched[domain] for domain in SEARCH_CONFIG}
 
     def _find_reasoning_rule(self, category: str) -> dict:
         """Find matching reasoning rule for a category."""
         category_lower = category.lower()
+        ui_categories = [c.lower() for c in self.reasoning_data.column("UI_Category")]
 
         # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
+        for rule_id, ui_cat in enumerate(ui_categories):
+            if ui_cat == category_lower:
+                return self.reasoning_data.row(rule_id)
 
         # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
+        for rule_id, ui_cat in enumerate(ui_categories):
             if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+                return self.reasoning_data.row(rule_id)
 
         # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
+        for rule_id, ui_cat in enumerate(ui_categories):
             keywords = ui_cat.replace("/", " ").replace("-", " ").split()
             if any(kw in category_lower for kw in keywords):
-                return rule
+                return self.reasoning_data.row(rule_id)
 
         return {}
 
@@ -163,7 +199,7 @@ class DesignSystemGenerator:
     def generate(self, query: str, project_name: str = None) -> dict:
         """Generate complete design system recommendation."""
         # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
+        product_result = search(query, "product", SEARCH_CONFIG["product"]["max_results"])
         product_results = product_result.get("results", [])
         category = "General"
         if product_results:
@@ -174,8 +210,7 @@ class DesignSystemGenerator:
         style_priority = reasoning.get("style_priority", [])
 
         # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+        search_results = self._multi_domain_search(query, style_priority, known={"product": product_result})
 
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
@@ -460,7 +495,8 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           executor: str = DEFAULT_SEARCH_EXECUTOR) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,16 +507,17 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        executor: How domain searches are dispatched ("thread", "process" or "sequential")
 
     Returns:
         Formatted design system string
     """
-    generator = DesignSystemGenerator()
+    generator = DesignSystemGenerator(executor)
     design_system = generator.generate(query, project_name)
     
     # Persist to files if requested
     if persist:
-        persist_design_system(design_system, page, output_dir, query)
+        persist_design_system(design_system, page, output_dir, query, generator.executor)
 
     if output_format == "markdown":
         return format_markdown(design_system)
@@ -488,7 +525,8 @@ def generate_design_system(query: str, project_name: str = None, output_format:
 
 
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None,
+                          executor: str = DEFAULT_SEARCH_EXECUTOR) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
     
@@ -497,6 +535,7 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        executor: How the page override searches are dispatched (see run_searches)
     
     Returns:
         dict with created file paths and status
@@ -527,7 +566,7 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     # If page is specified, create page override file with intelligent content
     if page:
         page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
+        page_content = format_page_override_md(design_system, page, page_query, executor)
         with open(page_file, 'w', encoding='utf-8') as f:
             f.write(page_content)
         created_files.append(str(page_file))
@@ -802,14 +841,15 @@ def format_master_md(design_system: dict) -> str:
     return "\n".join(lines)
 
 
-def format_page_override_md(design_system: dict, page_name: str, page_query: str = None) -> str:
+def format_page_override_md(design_system: dict, page_name: str, page_query: str = None,
+                            executor: str = DEFAULT_SEARCH_EXECUTOR) -> str:
     """Format a page-specific override file with intelligent AI-generated content."""
     project = design_system.get("project_name", "PROJECT")
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     page_title = page_name.replace("-", " ").replace("_", " ").title()
     
     # Detect page type and generate intelligent overrides
-    page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
+    page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system, executor)
     
     lines = []
     
@@ -911,23 +951,27 @@ def format_page_override_md(design_system: dict, page_name: str, page_query: str
     return "\n".join(lines)
 
 
-def _generate_intelligent_overrides(page_name: str, page_query: str, design_system: dict) -> dict:
+def _generate_intelligent_overrides(page_name: str, page_query: str, design_system: dict,
+                                    executor: str = DEFAULT_SEARCH_EXECUTOR) -> dict:
     """
     Generate intelligent overrides based on page type using layered search.
     
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
     page_lower = page_name.lower()
     query_lower = (page_query or "").lower()
     combined_context = f"{page_lower} {query_lower}"
     
     # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    page_searches = run_searches({
+        "style": (combined_context, "style", 1),
+        "ux": (combined_context, "ux", 3),
+        "landing": (combined_context, "landing", 1),
+    }, executor)
+    style_search = page_searches["style"]
+    ux_search = page_searches["ux"]
+    landing_search = page_searches["landing"]
     
     # Extract results from search response
     style_results = style_search.get("results", [])
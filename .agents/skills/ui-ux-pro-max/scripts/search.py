@@ -5,6 +5,8 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --batch queries.jsonl [--domain <domain>] [--stack <stack>]
+       python search.py --serve [--socket /path/to.sock]
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,13 +14,25 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+
+Batch mode:
+  --batch FILE One query per line (plain text, or JSON {"query", "domain", "stack", "max_results"});
+               use - for stdin. Prints one JSON result per line, in input order.
+
+Daemon (warm indexes across invocations):
+  --serve      Load every domain/stack index once and answer requests on a Unix socket
+  Later invocations use the daemon automatically and fall back to in-process search
 """
 
 import argparse
+import json
+import os
 import sys
 import io
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+from collections import defaultdict
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS
+from daemon import call, dispatch, serve
+from design_system import DEFAULT_SEARCH_EXECUTOR, SEARCH_EXECUTORS
 
 # Force UTF-8 for stdout/stderr to handle emojis on Windows (cp1252 default)
 if sys.stdout.encoding and sys.stdout.encoding.lower() != 'utf-8':
@@ -53,9 +67,68 @@ def format_output(result):
     return "\n".join(output)
 
 
+BATCH_CHUNK_SIZE = 256
+
+
+def parse_batch_line(line, defaults):
+    """Parse a batch line into a request dict; plain text lines are bare queries"""
+    stripped = line.strip()
+    if stripped.startswith("{"):
+        record = json.loads(stripped)
+        if not isinstance(record, dict) or not isinstance(record.get("query"), str):
+            raise ValueError("batch record must be a JSON object with a string 'query'")
+    else:
+        record = {"query": stripped}
+    request = {**defaults, **record}
+
+    domain, stack, max_results = request.get("domain"), request.get("stack"), request.get("max_results", MAX_RESULTS)
+    if domain is not None and (not isinstance(domain, str) or domain not in CSV_CONFIG):
+        raise ValueError(f"unknown domain {domain!r}; available: {', '.join(CSV_CONFIG)}")
+    if stack is not None and (not isinstance(stack, str) or stack not in AVAILABLE_STACKS):
+        raise ValueError(f"unknown stack {stack!r}; available: {', '.join(AVAILABLE_STACKS)}")
+    if isinstance(max_results, bool) or not isinstance(max_results, int) or max_results <= 0:
+        raise ValueError(f"max_results must be a positive integer, got {max_results!r}")
+    return request
+
+
+def run_batch(lines, defaults, run):
+    """Yield one result per non-empty line, scoring each chunk's queries per domain/stack in one pass"""
+    chunk = []
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            chunk.append(parse_batch_line(line, defaults))
+        except ValueError as exc:
+            chunk.append({"error": f"line {line_number}: {exc}"})
+        if len(chunk) >= BATCH_CHUNK_SIZE:
+            yield from _run_batch_chunk(chunk, run)
+            chunk = []
+    if chunk:
+        yield from _run_batch_chunk(chunk, run)
+
+
+def _run_batch_chunk(records, run):
+    groups = defaultdict(list)
+    for position, record in enumerate(records):
+        if "error" not in record:
+            groups[(record.get("stack"), record.get("domain"), record.get("max_results", MAX_RESULTS))].append(position)
+
+    results = [record if "error" in record else None for record in records]
+    for (stack, domain, max_results), positions in groups.items():
+        queries = [records[position]["query"] for position in positions]
+        if stack:
+            group_results = run("search_stack_many", queries=queries, stack=stack, max_results=max_results)
+        else:
+            group_results = run("search_many", queries=queries, domain=domain, max_results=max_results)
+        for position, result in zip(positions, group_results):
+            results[position] = result
+    return results
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
@@ -64,22 +137,55 @@ if __name__ == "__main__":
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
     parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
+    parser.add_argument("--executor", choices=SEARCH_EXECUTORS, default=DEFAULT_SEARCH_EXECUTOR, help="How design system domain searches are dispatched (default: thread)")
     # Persistence (Master + Overrides pattern)
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    # Daemon
+    parser.add_argument("--serve", action="store_true", help="Run a search daemon with all indexes kept warm")
+    parser.add_argument("--socket", type=str, default=None, help="Daemon socket path (default: $UI_PRO_MAX_SOCKET or a per-user temp file)")
+    parser.add_argument("--no-daemon", action="store_true", help="Always search in-process, even if a daemon is running")
+    # Batch
+    parser.add_argument("--batch", type=str, default=None, metavar="FILE", help="Run every query in FILE (- for stdin) and print JSONL results")
 
     args = parser.parse_args()
 
+    if args.serve:
+        try:
+            serve(args.socket)
+        except RuntimeError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+    if args.query is None and args.batch is None:
+        parser.error("the following arguments are required: query")
+
+    def run(op, **op_args):
+        if args.no_daemon:
+            return dispatch(op, op_args)
+        return call(op, op_args, args.socket)
+
+    if args.batch is not None:
+        defaults = {"domain": args.domain, "stack": args.stack, "max_results": args.max_results}
+        batch_file = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8")
+        with batch_file:
+            for result in run_batch(batch_file, defaults, run):
+                print(json.dumps(result, ensure_ascii=False), flush=True)
+        sys.exit(0)
+
     # Design system takes priority
     if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
+        result = run(
+            "generate_design_system",
+            query=args.query,
+            project_name=args.project_name,
+            output_format=args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
+            # The daemon has its own working directory, so resolve it here
+            output_dir=args.output_dir or (os.getcwd() if args.persist else None),
+            executor=args.executor
         )
         print(result)
         
@@ -98,17 +204,15 @@ if __name__ == "__main__":
             print("=" * 60)
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        result = run("search_stack", query=args.query, stack=args.stack, max_results=args.max_results)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        result = run("search", query=args.query, domain=args.domain, max_results=args.max_results)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the daemon client fallback.
+Usage: python test_daemon.py
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from daemon import call, dispatch
+
+
+SEARCH_ARGS = {"query": "saas dashboard", "domain": "product", "max_results": 3}
+
+
+class CallFallbackTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.expected = dispatch("search", SEARCH_ARGS)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_overlong_socket_path_runs_in_process(self):
+        socket_path = self.root / ("d" * 200) / "ui-ux-pro-max.sock"
+
+        self.assertEqual(call("search", SEARCH_ARGS, socket_path), self.expected)
+
+    def test_missing_socket_runs_in_process(self):
+        self.assertEqual(call("search", SEARCH_ARGS, self.root / "missing.sock"), self.expected)
+
+    def test_non_socket_path_runs_in_process(self):
+        socket_path = self.root / "not-a-socket"
+        socket_path.mkdir()
+
+        self.assertEqual(call("search", SEARCH_ARGS, socket_path), self.expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
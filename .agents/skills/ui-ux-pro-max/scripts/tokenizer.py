@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Tokenizer - precompiled tokenization for the BM25 index
+
+Usage:
+    from tokenizer import Tokenizer
+    tokenizer = Tokenizer()
+    tokenizer.tokenize("Glassmorphism, dark-mode UI")   # ['glassmorphism', 'dark', 'mode']
+    tokenizer.tokenize_many(column_values)              # one token list per value, used by BM25.fit
+    tokenizer.tokenize_query("dark mode")               # LRU-cached, returns a tuple
+
+Benchmark:
+    python tokenizer.py --bench
+"""
+
+import re
+import time
+from functools import lru_cache
+
+# ============ CONFIGURATION ============
+NON_WORD_RE = re.compile(r"[^\w\s]")
+MIN_TOKEN_LEN = 3
+QUERY_CACHE_SIZE = 4096
+
+# Ordered longest first so "ies" wins over "s"
+_STEM_SUFFIXES = (("ies", "y"), ("ing", ""), ("es", ""), ("ed", ""), ("s", ""))
+
+
+def light_stem(word):
+    """Strip common English inflections, keeping at least MIN_TOKEN_LEN characters"""
+    for suffix, replacement in _STEM_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= MIN_TOKEN_LEN:
+            return word[:-len(suffix)] + replacement
+    return word
+
+
+class Tokenizer:
+    """Lowercase, strip punctuation, split on whitespace, drop short words
+
+    stem: apply light_stem to every token
+    synonyms: token -> canonical token, applied after stemming
+    """
+
+    def __init__(self, stem=False, synonyms=None):
+        self.stem = stem
+        self.synonyms = dict(synonyms or {})
+        self.tokenize_query = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._tokenize_query)
+
+    @property
+    def signature(self):
+        """Identifies the token stream; persisted indexes built with another signature are rebuilt"""
+        return {"stem": self.stem, "synonyms": [list(item) for item in sorted(self.synonyms.items())]}
+
+    def _normalize(self, words):
+        if self.stem:
+            words = [light_stem(w) for w in words]
+        if self.synonyms:
+            words = [self.synonyms.get(w, w) for w in words]
+        return words
+
+    def tokenize(self, text):
+        """Tokenize one text"""
+        text = NON_WORD_RE.sub(" ", str(text).lower())
+        return self._normalize([w for w in text.split() if len(w) >= MIN_TOKEN_LEN])
+
+    def _tokenize_query(self, text):
+        return tuple(self.tokenize(text))
+
+    def tokenize_many(self, texts):
+        """Tokenize a whole column, one token list per text"""
+        tokenize = self.tokenize
+        return [tokenize(t) for t in texts]
+
+
+DEFAULT_TOKENIZER = Tokenizer()
+
+
+# ============ BENCHMARK ============
+def _legacy_tokenize(text):
+    """The original per-call implementation, kept for comparison"""
+    text = re.sub(r'[^\w\s]', ' ', str(text).lower())
+    return [w for w in text.split() if len(w) > 2]
+
+
+def _bench_documents():
+    from core import CSV_CONFIG, STACK_CONFIG, DATA_DIR, _STACK_COLS, _build_documents, load_csv
+    documents = []
+    for config in CSV_CONFIG.values():
+        documents += _build_documents(load_csv(DATA_DIR / config["file"]), config["search_cols"])
+    for config in STACK_CONFIG.values():
+        documents += _build_documents(load_csv(DATA_DIR / config["file"]), _STACK_COLS["search_cols"])
+    return documents
+
+
+def benchmark(repeat=20):
+    """Tokens/sec of the legacy and precompiled paths over every searchable document"""
+    documents = _bench_documents()
+    tokenizer = Tokenizer()
+    paths = {
+        "legacy re.sub": lambda: [_legacy_tokenize(d) for d in documents],
+        "tokenize": lambda: [tokenizer.tokenize(d) for d in documents],
+    }
+    n_tokens = sum(len(tokens) for tokens in tokenizer.tokenize_many(documents))
+    report = {}
+    for name, run in paths.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            run()
+        elapsed = time.perf_counter() - start
+        report[name] = n_tokens * repeat / elapsed
+    return len(documents), n_tokens, report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="UI Pro Max tokenizer")
+    parser.add_argument("--bench", action="store_true", help="Measure tokens/sec over all CSV documents")
+    parser.add_argument("--repeat", type=int, default=20, help="Benchmark repetitions (default: 20)")
+    parser.add_argument("text", nargs="?", help="Text to tokenize")
+    args = parser.parse_args()
+
+    if args.bench:
+        n_docs, n_tokens, report = benchmark(args.repeat)
+        print(f"{n_docs} documents, {n_tokens} tokens, {args.repeat} repetitions")
+        for name, rate in report.items():
+            print(f"  {name:<14} {rate:>12,.0f} tokens/sec")
+    elif args.text is not None:
+        print(DEFAULT_TOKENIZER.tokenize(args.text))
+    else:
+        parser.print_help()
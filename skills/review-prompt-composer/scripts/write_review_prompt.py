@@ -10,6 +10,7 @@ import re
 import subprocess
 import sys
 import tempfile
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -24,6 +25,8 @@ SCOPES = (
 )
 PROMPT_TOKEN = "{{REVIEW_PROMPT_ID}}"
 PROMPT_TTL = timedelta(hours=24)
+# How long an empty reservation from allocate_prompt_path counts as in flight.
+RESERVATION_GRACE = timedelta(minutes=1)
 REQUIRED_HEADINGS = (
     "# 审核任务",
     "## 工作区与范围",
@@ -33,6 +36,7 @@ REQUIRED_HEADINGS = (
     "## 输出要求",
 )
 PRIVATE_KEY_MARKER = re.compile(r"-----BEGIN [A-Z0-9 ]*PRIVATE KEY-----")
+REVIEW_HANDOFF_DIR = ".review-handoff"
 CREDENTIAL_URL = re.compile(
     r"[a-z][a-z0-9+.-]*://[^\s/:@]+:[^\s/@]+@",
     re.IGNORECASE,
@@ -49,6 +53,12 @@ class ArchiveResult:
     warnings: tuple[str, ...]
 
 
+@dataclass(frozen=True)
+class GitTiming:
+    command: str
+    duration_ms: float
+
+
 @dataclass(frozen=True)
 class PromptArtifact:
     prompt_path: Path
@@ -60,30 +70,106 @@ class PromptArtifact:
     expires_at: datetime
     archived_paths: tuple[Path, ...] = ()
     warnings: tuple[str, ...] = ()
+    git_timings: tuple[GitTiming, ...] = ()
 
 
-def run_git(repo: Path, *args: str) -> bytes:
-    result = subprocess.run(
-        ["git", *args],
-        cwd=repo,
-        check=False,
-        capture_output=True,
-    )
+def run_git(
+    repo: Path,
+    *args: str,
+    timings: list[GitTiming] | None = None,
+) -> bytes:
+    started = time.perf_counter()
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=repo,
+            check=False,
+            capture_output=True,
+        )
+    finally:
+        if timings is not None:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            timings.append(GitTiming(f"git {' '.join(args)}", round(elapsed_ms, 3)))
     if result.returncode != 0:
         message = result.stderr.decode("utf-8", errors="replace").strip()
         raise WriterError(f"git {' '.join(args)} failed: {message}")
     return result.stdout
 
 
-def resolve_repo(raw_repo: str | Path) -> Path:
+def resolve_repo(
+    raw_repo: str | Path,
+    timings: list[GitTiming] | None = None,
+) -> Path:
     candidate = Path(raw_repo).expanduser().resolve()
     try:
-        root = os.fsdecode(run_git(candidate, "rev-parse", "--show-toplevel")).strip()
+        root = os.fsdecode(
+            run_git(candidate, "rev-parse", "--show-toplevel", timings=timings),
+        ).strip()
     except (OSError, WriterError) as exc:
         raise WriterError(f"Not a Git repository: {candidate}") from exc
     return Path(root).resolve()
 
 
+class GitSession:
+    """Repository metadata resolved once, plus a runner that records timings.
+
+    A single rev-parse call yields the top-level directory, common Git
+    directory, HEAD commit and branch; later Git calls reuse the resolved
+    top-level as their working directory.
+    """
+
+    def __init__(
+        self,
+        repo: Path,
+        branch: str,
+        head: str,
+        common_dir: Path,
+        timings: list[GitTiming] | None = None,
+    ) -> None:
+        self.repo = repo
+        self.branch = branch
+        self.head = head
+        self.common_dir = common_dir
+        self.timings: list[GitTiming] = [] if timings is None else timings
+
+    @classmethod
+    def open(
+        cls,
+        raw_repo: str | Path,
+        timings: list[GitTiming] | None = None,
+    ) -> GitSession:
+        candidate = Path(raw_repo).expanduser().resolve()
+        timings = [] if timings is None else timings
+        try:
+            output = run_git(
+                candidate,
+                "rev-parse",
+                "--show-toplevel",
+                "--git-common-dir",
+                "HEAD",
+                "--abbrev-ref",
+                "HEAD",
+                timings=timings,
+            )
+        except OSError as exc:
+            raise WriterError(f"Not a Git repository: {candidate}") from exc
+        except WriterError:
+            # Distinguish "not a repository" from a repository without HEAD.
+            resolve_repo(candidate, timings)
+            raise
+        lines = os.fsdecode(output).splitlines()
+        if len(lines) != 4:
+            raise WriterError(f"Unexpected git rev-parse output in {candidate}")
+        raw_toplevel, raw_common_dir, head, branch = (line.strip() for line in lines)
+        common_dir = Path(raw_common_dir)
+        if not common_dir.is_absolute():
+            common_dir = (candidate / common_dir).resolve()
+        return cls(Path(raw_toplevel).resolve(), branch, head, common_dir, timings)
+
+    def run(self, *args: str) -> bytes:
+        return run_git(self.repo, *args, timings=self.timings)
+
+
 def normalize_branch_slug(branch: str) -> str:
     normalized = branch.lower().replace("/", "-").replace("\\", "-")
     normalized = re.sub(r"[^a-z0-9._-]+", "-", normalized).strip("-.")
@@ -94,7 +180,34 @@ def format_utc(value: datetime) -> str:
     return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def atomic_write_text(path: Path, content: str) -> None:
+class SyncPlan:
+    """Directories whose entries are fsynced once after a group of writes.
+
+    Files written with a plan are fsynced before their rename; the
+    renames themselves become durable when flush() syncs each touched
+    directory, once per directory however many prompts it received.
+    """
+
+    def __init__(self) -> None:
+        self.directories: set[Path] = set()
+
+    def flush(self) -> None:
+        for directory in sorted(self.directories):
+            try:
+                descriptor = os.open(directory, os.O_RDONLY)
+            except OSError:
+                # Directories cannot be opened for fsync on every platform.
+                continue
+            try:
+                os.fsync(descriptor)
+            except OSError:
+                pass
+            finally:
+                os.close(descriptor)
+        self.directories.clear()
+
+
+def atomic_write_text(path: Path, content: str, sync: SyncPlan | None = None) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     temporary_path: Path | None = None
     try:
@@ -107,20 +220,19 @@ def atomic_write_text(path: Path, content: str) -> None:
         ) as temporary:
             temporary.write(content)
             temporary_path = Path(temporary.name)
+            if sync is not None:
+                temporary.flush()
+                os.fsync(temporary.fileno())
         os.replace(temporary_path, path)
+        if sync is not None:
+            sync.directories.add(path.parent)
     finally:
         if temporary_path is not None and temporary_path.exists():
             temporary_path.unlink()
 
 
-def ensure_review_handoff_excluded(repo: Path) -> Path:
-    raw_common_dir = os.fsdecode(
-        run_git(repo, "rev-parse", "--git-common-dir"),
-    ).strip()
-    common_dir = Path(raw_common_dir)
-    if not common_dir.is_absolute():
-        common_dir = (repo / common_dir).resolve()
-    exclude_file = common_dir / "info" / "exclude"
+def ensure_review_handoff_excluded(session: GitSession) -> Path:
+    exclude_file = session.common_dir / "info" / "exclude"
     existing = exclude_file.read_text(encoding="utf-8") if exclude_file.exists() else ""
     if not re.search(r"(?m)^/?\.review-handoff/$", existing):
         separator = "" if not existing or existing.endswith("\n") else "\n"
@@ -128,6 +240,29 @@ def ensure_review_handoff_excluded(repo: Path) -> Path:
     return exclude_file
 
 
+def review_handoff_is_ignored(session: GitSession, paranoid: bool = False) -> bool:
+    """Check that nothing under .review-handoff shows up in git status.
+
+    The pathspec keeps Git from walking the rest of the working tree; the
+    paranoid mode repeats the check against a full-tree status.
+    """
+    scoped_status = session.run(
+        "status",
+        "--porcelain",
+        "--untracked-files=all",
+        "--",
+        REVIEW_HANDOFF_DIR,
+    )
+    if scoped_status.strip():
+        return False
+    if not paranoid:
+        return True
+    full_status = os.fsdecode(
+        session.run("status", "--short", "--untracked-files=all"),
+    )
+    return REVIEW_HANDOFF_DIR not in full_status
+
+
 def validate_body(body: str) -> None:
     if not body.strip():
         raise WriterError("Prompt body must not be empty")
@@ -179,65 +314,248 @@ def parse_utc_timestamp(value: str) -> datetime:
     return parsed.astimezone(timezone.utc)
 
 
+@dataclass(frozen=True)
+class ManifestEntry:
+    name: str
+    prompt_id: str
+    expires_at: datetime
+    mtime_ns: int | None = None
+    size: int | None = None
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Whether the prompt file is unchanged since this entry was recorded."""
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+
+def stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def manifest_path(repo: Path, branch_slug: str) -> Path:
+    return repo / ".review-handoff" / "prompts" / "manifests" / f"{branch_slug}.jsonl"
+
+
+def manifest_record(op: str, name: str, entry: ManifestEntry | None = None) -> str:
+    record: dict[str, str | int] = {"op": op, "name": name}
+    if entry is not None:
+        record["prompt_id"] = entry.prompt_id
+        record["expires_at"] = format_utc(entry.expires_at)
+        if entry.mtime_ns is not None and entry.size is not None:
+            record["mtime_ns"] = entry.mtime_ns
+            record["size"] = entry.size
+    return json.dumps(record, ensure_ascii=True) + "\n"
+
+
+def read_manifest(path: Path) -> tuple[dict[str, ManifestEntry], int] | None:
+    """Replay an append-only manifest into active entries and its line count.
+
+    Returns None when the manifest does not exist. Unreadable lines are
+    skipped; the sweep adopts any prompt they hid as an unlisted file.
+    """
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return None
+    try:
+        # One decode for the whole log; per line only when a line is damaged.
+        records = json.loads(f"[{','.join(line for line in lines if line.strip())}]")
+    except ValueError:
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    entries: dict[str, ManifestEntry] = {}
+    for record in records:
+        try:
+            name = record["name"]
+            if record["op"] == "add":
+                entries[name] = ManifestEntry(
+                    name,
+                    record["prompt_id"],
+                    parse_utc_timestamp(record["expires_at"]),
+                    record.get("mtime_ns"),
+                    record.get("size"),
+                )
+            elif record["op"] == "remove":
+                entries.pop(name, None)
+        except (KeyError, TypeError, ValueError, WriterError):
+            continue
+    return entries, len(lines)
+
+
+def append_manifest(path: Path, records: list[str]) -> None:
+    if not records:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # One O_APPEND write keeps lines from concurrent writers whole.
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(descriptor, "".join(records).encode("utf-8"))
+    finally:
+        os.close(descriptor)
+
+
+def write_manifest(path: Path, entries: dict[str, ManifestEntry]) -> None:
+    ordered = sorted(entries.values(), key=lambda entry: entry.expires_at)
+    atomic_write_text(path, "".join(manifest_record("add", e.name, e) for e in ordered))
+
+
+def archive_prompt_if_expired(
+    prompt_path: Path,
+    archive_dir: Path,
+    branch_slug: str,
+    now: datetime,
+    stat: os.stat_result | None = None,
+) -> tuple[Path | None, ManifestEntry | None]:
+    """Validate one active prompt and archive it once expired.
+
+    Returns the archive destination for an archived prompt, or the
+    manifest entry of a prompt that stays active. The entry carries the
+    modification time and size from ``stat``, taken before the file was
+    read, so any later edit sends the prompt back through validation.
+    """
+    metadata, _ = parse_frontmatter(prompt_path)
+    prompt_id = metadata.get("prompt_id")
+    state = metadata.get("lifecycle_state")
+    expires_at = metadata.get("expires_at")
+    head = metadata.get("head")
+    scope = metadata.get("scope")
+    if not prompt_id or not state or not expires_at or not head or not scope:
+        raise WriterError("missing prompt lifecycle metadata")
+    if metadata.get("artifact_type") != "review_prompt":
+        raise WriterError("artifact_type is not review_prompt")
+    if metadata.get("format_version") != "1":
+        raise WriterError("unsupported format_version")
+    expected_prompt_id = f"{branch_slug}/{prompt_path.stem}"
+    if prompt_id != expected_prompt_id:
+        raise WriterError("prompt_id does not match its repository path")
+    if not re.fullmatch(r"[0-9a-f]{40}", head):
+        raise WriterError("head is not a 40-character Git SHA")
+    if scope not in SCOPES:
+        raise WriterError(f"unsupported prompt scope: {scope}")
+    expires_at_value = parse_utc_timestamp(expires_at)
+    is_expired = state == "expired" or expires_at_value <= now
+    if not is_expired:
+        if state != "active":
+            raise WriterError(f"unsupported lifecycle_state: {state}")
+        return None, ManifestEntry(
+            prompt_path.name,
+            prompt_id,
+            expires_at_value,
+            stat.st_mtime_ns if stat is not None else None,
+            stat.st_size if stat is not None else None,
+        )
+
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    destination = archive_dir / prompt_path.name
+    if destination.exists():
+        raise WriterError("matching archive prompt already exists")
+    content = prompt_path.read_text(encoding="utf-8")
+    if state != "expired":
+        updated = re.sub(
+            r"(?m)^lifecycle_state:\s*active\s*$",
+            "lifecycle_state: expired",
+            content,
+            count=1,
+        )
+        if updated == content:
+            raise WriterError("active lifecycle metadata could not be updated")
+        atomic_write_text(prompt_path, updated)
+    os.replace(prompt_path, destination)
+    return destination, None
+
+
 def archive_expired_prompts(
     repo: Path,
     branch_slug: str,
     now: datetime,
 ) -> ArchiveResult:
+    """Archive expired prompts of one branch.
+
+    The branch manifest records every prompt's expiry, modification time
+    and size, so only prompts that are due, that changed since they were
+    recorded, or that the manifest does not list yet are opened; the rest
+    cost one stat each. Without a manifest every prompt is inspected once
+    and the manifest is rebuilt.
+    """
     active_dir = repo / ".review-handoff" / "prompts" / "active" / branch_slug
     archive_dir = repo / ".review-handoff" / "prompts" / "archive" / branch_slug
     if not active_dir.exists():
         return ArchiveResult((), ())
 
+    normalized_now = now.astimezone(timezone.utc)
+    manifest_file = manifest_path(repo, branch_slug)
+    manifest = read_manifest(manifest_file)
+    stats: dict[str, os.stat_result] = {}
+    with os.scandir(active_dir) as listing:
+        for dir_entry in listing:
+            if dir_entry.name.endswith(".md"):
+                try:
+                    stats[dir_entry.name] = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+    present = stats.keys()
+    if manifest is None:
+        listed: dict[str, ManifestEntry] = {}
+        line_count = 0
+        candidates = set(present)
+    else:
+        listed, line_count = manifest
+        candidates = {
+            name
+            for name in present
+            if name not in listed
+            or listed[name].expires_at <= normalized_now
+            or not listed[name].matches(stats[name])
+        }
+
     archived_paths: list[Path] = []
     warnings: list[str] = []
-    normalized_now = now.astimezone(timezone.utc)
-    for prompt_path in sorted(active_dir.glob("*.md")):
+    entries = {name: entry for name, entry in listed.items() if name in present}
+    for name in sorted(candidates):
+        prompt_path = active_dir / name
         try:
-            metadata, _ = parse_frontmatter(prompt_path)
-            prompt_id = metadata.get("prompt_id")
-            state = metadata.get("lifecycle_state")
-            expires_at = metadata.get("expires_at")
-            head = metadata.get("head")
-            scope = metadata.get("scope")
-            if not prompt_id or not state or not expires_at or not head or not scope:
-                raise WriterError("missing prompt lifecycle metadata")
-            if metadata.get("artifact_type") != "review_prompt":
-                raise WriterError("artifact_type is not review_prompt")
-            if metadata.get("format_version") != "1":
-                raise WriterError("unsupported format_version")
-            expected_prompt_id = f"{branch_slug}/{prompt_path.stem}"
-            if prompt_id != expected_prompt_id:
-                raise WriterError("prompt_id does not match its repository path")
-            if not re.fullmatch(r"[0-9a-f]{40}", head):
-                raise WriterError("head is not a 40-character Git SHA")
-            if scope not in SCOPES:
-                raise WriterError(f"unsupported prompt scope: {scope}")
-            is_expired = state == "expired" or parse_utc_timestamp(expires_at) <= normalized_now
-            if not is_expired:
-                if state != "active":
-                    raise WriterError(f"unsupported lifecycle_state: {state}")
-                continue
-
-            archive_dir.mkdir(parents=True, exist_ok=True)
-            destination = archive_dir / prompt_path.name
-            if destination.exists():
-                raise WriterError("matching archive prompt already exists")
-            content = prompt_path.read_text(encoding="utf-8")
-            if state != "expired":
-                updated = re.sub(
-                    r"(?m)^lifecycle_state:\s*active\s*$",
-                    "lifecycle_state: expired",
-                    content,
-                    count=1,
-                )
-                if updated == content:
-                    raise WriterError("active lifecycle metadata could not be updated")
-                atomic_write_text(prompt_path, updated)
-            os.replace(prompt_path, destination)
-            archived_paths.append(destination)
+            if name not in listed and stats[name].st_size == 0:
+                # A reservation from allocate_prompt_path: skip it while it may
+                # still be written, report it once its writer is clearly gone.
+                reserved_at = datetime.fromtimestamp(stats[name].st_mtime, timezone.utc)
+                if normalized_now - reserved_at < RESERVATION_GRACE:
+                    continue
+                raise WriterError("empty prompt left by an interrupted write")
+            destination, entry = archive_prompt_if_expired(
+                prompt_path,
+                archive_dir,
+                branch_slug,
+                normalized_now,
+                stats[name],
+            )
         except (OSError, UnicodeError, WriterError) as exc:
             warnings.append(f"{prompt_path.name}: {exc}")
+            continue
+        if destination is not None:
+            archived_paths.append(destination)
+            entries.pop(name, None)
+        elif entry is not None:
+            entries[name] = entry
+
+    try:
+        if manifest is None or line_count > 2 * len(entries) + 32:
+            write_manifest(manifest_file, entries)
+        else:
+            records = [manifest_record("remove", name) for name in sorted(listed.keys() - entries.keys())]
+            records += [
+                manifest_record("add", name, entry)
+                for name, entry in sorted(entries.items())
+                if listed.get(name) != entry
+            ]
+            append_manifest(manifest_file, records)
+    except OSError as exc:
+        warnings.append(f"{manifest_file.name}: {exc}")
 
     return ArchiveResult(tuple(archived_paths), tuple(warnings))
 
@@ -248,40 +566,69 @@ def allocate_prompt_path(
     scope: str,
     created_at: datetime,
 ) -> Path:
+    """Reserve a free prompt filename for this minute and scope.
+
+    Both folders are listed once, active first so that a prompt archived
+    meanwhile is still seen, and the chosen name is claimed with an
+    exclusive create. A concurrent writer that wins the race only moves
+    this writer to the next suffix. The caller replaces the empty
+    reservation with the prompt, or removes it on failure.
+    """
     active_dir = repo / ".review-handoff" / "prompts" / "active" / branch_slug
     archive_dir = repo / ".review-handoff" / "prompts" / "archive" / branch_slug
+    active_dir.mkdir(parents=True, exist_ok=True)
+    taken: set[str] = set()
+    for directory in (active_dir, archive_dir):
+        try:
+            taken.update(os.listdir(directory))
+        except FileNotFoundError:
+            continue
+
     local_stamp = created_at.astimezone().strftime("%Y-%m-%d_%H-%M")
     base_name = f"{local_stamp}-{scope}"
     suffix = 1
     while True:
         collision_suffix = "" if suffix == 1 else f"-{suffix:02d}"
         filename = f"{base_name}{collision_suffix}.md"
-        active_path = active_dir / filename
-        archive_path = archive_dir / filename
-        if not active_path.exists() and not archive_path.exists():
-            return active_path
         suffix += 1
+        if filename in taken:
+            continue
+        active_path = active_dir / filename
+        try:
+            descriptor = os.open(active_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            taken.add(filename)
+            continue
+        os.close(descriptor)
+        return active_path
 
 
-def create_review_prompt(
-    repo: Path,
+@dataclass(frozen=True)
+class PromptRequest:
+    repo: Path
+    scope: str
+    body: str
+
+
+@dataclass(frozen=True)
+class PendingPrompt:
+    session: GitSession
+    branch_slug: str
+    prompt_path: Path
+    prompt_id: str
+    scope: str
+    archive_result: ArchiveResult
+
+
+def write_prompt_file(
+    session: GitSession,
+    branch_slug: str,
     scope: str,
     body: str,
-    now: datetime | None = None,
-) -> PromptArtifact:
-    if scope not in SCOPES:
-        raise WriterError(f"Unsupported scope: {scope}")
-    validate_body(body)
-    repo = resolve_repo(repo)
-    branch = os.fsdecode(run_git(repo, "rev-parse", "--abbrev-ref", "HEAD")).strip()
-    head = os.fsdecode(run_git(repo, "rev-parse", "HEAD")).strip()
-    branch_slug = normalize_branch_slug(branch)
-    created_at = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
-    expires_at = created_at + PROMPT_TTL
-
-    ensure_review_handoff_excluded(repo)
-    archive_result = archive_expired_prompts(repo, branch_slug, created_at)
-    prompt_path = allocate_prompt_path(repo, branch_slug, scope, created_at)
+    created_at: datetime,
+    sync: SyncPlan,
+) -> tuple[Path, str]:
+    prompt_path = allocate_prompt_path(session.repo, branch_slug, scope, created_at)
     prompt_id = f"{branch_slug}/{prompt_path.stem}"
 
     rendered_body = body.replace(PROMPT_TOKEN, prompt_id)
@@ -291,36 +638,167 @@ def create_review_prompt(
             "artifact_type: review_prompt",
             "format_version: 1",
             f"prompt_id: {frontmatter_value(prompt_id)}",
-            f"branch: {frontmatter_value(branch)}",
-            f"head: {frontmatter_value(head)}",
+            f"branch: {frontmatter_value(session.branch)}",
+            f"head: {frontmatter_value(session.head)}",
             f"scope: {frontmatter_value(scope)}",
             f"created_at: {frontmatter_value(format_utc(created_at))}",
-            f"expires_at: {frontmatter_value(format_utc(expires_at))}",
+            f"expires_at: {frontmatter_value(format_utc(created_at + PROMPT_TTL))}",
             "lifecycle_state: active",
             "---",
             "",
         ],
     )
-    atomic_write_text(prompt_path, f"{frontmatter}{rendered_body.rstrip()}\n")
-
-    status = os.fsdecode(
-        run_git(repo, "status", "--short", "--untracked-files=all"),
-    )
-    if ".review-handoff" in status:
+    try:
+        atomic_write_text(prompt_path, f"{frontmatter}{rendered_body.rstrip()}\n", sync)
+    except BaseException:
         prompt_path.unlink(missing_ok=True)
-        raise WriterError("Generated review prompt is not ignored by Git")
-
-    return PromptArtifact(
-        prompt_path=prompt_path,
-        prompt_id=prompt_id,
-        branch=branch,
-        head=head,
-        scope=scope,
-        created_at=created_at,
-        expires_at=expires_at,
-        archived_paths=archive_result.archived_paths,
-        warnings=archive_result.warnings,
-    )
+        raise
+    return prompt_path, prompt_id
+
+
+def create_review_prompts(
+    requests: list[PromptRequest],
+    now: datetime | None = None,
+    paranoid: bool = False,
+) -> list[PromptArtifact | OSError | UnicodeError | WriterError]:
+    """Write several prompts, sharing Git work and durability syncs.
+
+    Git metadata is resolved once per repository, the exclude entry and
+    archive sweep run once per branch slug, directories are fsynced once
+    at the end, and the ignore check runs once per repository. Results
+    follow the request order; a failed request yields its exception.
+    """
+    created_at = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    expires_at = created_at + PROMPT_TTL
+    results: list[PromptArtifact | OSError | UnicodeError | WriterError | None] = [None] * len(requests)
+    sessions: dict[Path, GitSession | WriterError] = {}
+    roots: dict[Path, GitSession] = {}
+    sweeps: dict[tuple[Path, str], ArchiveResult] = {}
+    pending: dict[int, PendingPrompt] = {}
+    sync = SyncPlan()
+
+    for index, request in enumerate(requests):
+        try:
+            if request.scope not in SCOPES:
+                raise WriterError(f"Unsupported scope: {request.scope}")
+            validate_body(request.body)
+            key = Path(request.repo).expanduser().resolve()
+            session = sessions.get(key)
+            if session is None:
+                try:
+                    opened = GitSession.open(key)
+                    session = roots.setdefault(opened.repo, opened)
+                except WriterError as exc:
+                    session = exc
+                sessions[key] = session
+            if isinstance(session, WriterError):
+                raise session
+
+            branch_slug = normalize_branch_slug(session.branch)
+            sweep_key = (session.repo, branch_slug)
+            archive_result = ArchiveResult((), ())
+            if sweep_key not in sweeps:
+                ensure_review_handoff_excluded(session)
+                archive_result = archive_expired_prompts(session.repo, branch_slug, created_at)
+                sweeps[sweep_key] = archive_result
+
+            prompt_path, prompt_id = write_prompt_file(
+                session,
+                branch_slug,
+                request.scope,
+                request.body,
+                created_at,
+                sync,
+            )
+            pending[index] = PendingPrompt(
+                session,
+                branch_slug,
+                prompt_path,
+                prompt_id,
+                request.scope,
+                archive_result,
+            )
+        except (OSError, UnicodeError, WriterError) as exc:
+            results[index] = exc
+
+    sync.flush()
+
+    for session in roots.values():
+        indexes = [index for index, prompt in pending.items() if prompt.session is session]
+        if not indexes:
+            continue
+        try:
+            ignored = review_handoff_is_ignored(session, paranoid)
+        except WriterError as exc:
+            ignored, failure = False, exc
+        else:
+            failure = WriterError("Generated review prompt is not ignored by Git")
+        if not ignored:
+            for index in indexes:
+                pending.pop(index).prompt_path.unlink(missing_ok=True)
+                results[index] = failure
+            continue
+
+        manifest_warnings: dict[str, str] = {}
+        for branch_slug in sorted({pending[index].branch_slug for index in indexes}):
+            manifest_file = manifest_path(session.repo, branch_slug)
+            records = []
+            for index in indexes:
+                prompt = pending[index]
+                if prompt.branch_slug != branch_slug:
+                    continue
+                stat = stat_or_none(prompt.prompt_path)
+                records.append(
+                    manifest_record(
+                        "add",
+                        prompt.prompt_path.name,
+                        ManifestEntry(
+                            prompt.prompt_path.name,
+                            prompt.prompt_id,
+                            expires_at,
+                            stat.st_mtime_ns if stat is not None else None,
+                            stat.st_size if stat is not None else None,
+                        ),
+                    )
+                )
+            try:
+                append_manifest(manifest_file, records)
+            except OSError as exc:
+                # The next sweep adopts prompts missing from the manifest.
+                manifest_warnings[branch_slug] = f"{manifest_file.name}: {exc}"
+
+        for index in indexes:
+            prompt = pending[index]
+            warnings = list(prompt.archive_result.warnings)
+            if prompt.branch_slug in manifest_warnings:
+                warnings.append(manifest_warnings[prompt.branch_slug])
+            results[index] = PromptArtifact(
+                prompt_path=prompt.prompt_path,
+                prompt_id=prompt.prompt_id,
+                branch=session.branch,
+                head=session.head,
+                scope=prompt.scope,
+                created_at=created_at,
+                expires_at=expires_at,
+                archived_paths=prompt.archive_result.archived_paths,
+                warnings=tuple(warnings),
+                git_timings=tuple(session.timings),
+            )
+
+    return [result for result in results if result is not None]
+
+
+def create_review_prompt(
+    repo: Path,
+    scope: str,
+    body: str,
+    now: datetime | None = None,
+    paranoid: bool = False,
+) -> PromptArtifact:
+    [result] = create_review_prompts([PromptRequest(repo, scope, body)], now, paranoid)
+    if not isinstance(result, PromptArtifact):
+        raise result
+    return result
 
 
 def read_body_file(raw_path: str) -> str:
@@ -329,6 +807,19 @@ def read_body_file(raw_path: str) -> str:
     return Path(raw_path).expanduser().read_text(encoding="utf-8")
 
 
+def parse_batch_record(line: str) -> PromptRequest:
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise WriterError(f"invalid JSON: {exc.msg}") from exc
+    if not isinstance(record, dict):
+        raise WriterError("batch record must be a JSON object")
+    for key in ("repo", "scope", "body"):
+        if not isinstance(record.get(key), str):
+            raise WriterError(f"batch record field {key} must be a string")
+    return PromptRequest(Path(record["repo"]), record["scope"], record["body"])
+
+
 def serialize_artifact(artifact: PromptArtifact) -> dict[str, object]:
     payload = asdict(artifact)
     payload["prompt_path"] = str(artifact.prompt_path)
@@ -336,6 +827,7 @@ def serialize_artifact(artifact: PromptArtifact) -> dict[str, object]:
     payload["expires_at"] = format_utc(artifact.expires_at)
     payload["archived_paths"] = [str(path) for path in artifact.archived_paths]
     payload["warnings"] = list(artifact.warnings)
+    payload["git_timings"] = [asdict(timing) for timing in artifact.git_timings]
     return payload
 
 
@@ -343,21 +835,77 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Write one repository-local review prompt",
     )
-    parser.add_argument("--repo", required=True, help="Path inside the Git repository")
-    parser.add_argument("--scope", required=True, choices=SCOPES)
+    parser.add_argument("--repo", help="Path inside the Git repository")
+    parser.add_argument("--scope", choices=SCOPES)
     parser.add_argument(
         "--body-file",
-        required=True,
         help="UTF-8 prompt body path, or - to read stdin",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--batch",
+        help=(
+            "JSONL file, or - for stdin, with one {repo, scope, body} object per line; "
+            "prints one JSON result per line"
+        ),
+    )
+    parser.add_argument(
+        "--paranoid",
+        action="store_true",
+        help="Also confirm the prompt is ignored with a full working-tree git status",
+    )
+    args = parser.parse_args(argv)
+    single_args = (args.repo, args.scope, args.body_file)
+    if args.batch is not None and any(value is not None for value in single_args):
+        parser.error("--batch cannot be combined with --repo, --scope, or --body-file")
+    if args.batch is None and any(value is None for value in single_args):
+        parser.error("--repo, --scope, and --body-file are required unless --batch is used")
+    return args
+
+
+def run_batch(raw_path: str, paranoid: bool) -> int:
+    try:
+        lines = read_body_file(raw_path).splitlines()
+    except (OSError, UnicodeError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
+    outcomes: dict[int, PromptArtifact | OSError | UnicodeError | WriterError] = {}
+    requests: list[PromptRequest] = []
+    request_lines: list[int] = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            requests.append(parse_batch_record(line))
+            request_lines.append(line_number)
+        except WriterError as exc:
+            outcomes[line_number] = exc
+    outcomes.update(zip(request_lines, create_review_prompts(requests, paranoid=paranoid)))
+
+    failed = False
+    for line_number in sorted(outcomes):
+        outcome = outcomes[line_number]
+        if isinstance(outcome, PromptArtifact):
+            payload: dict[str, object] = {"line": line_number, **serialize_artifact(outcome)}
+        else:
+            failed = True
+            payload = {"line": line_number, "error": str(outcome)}
+        print(json.dumps(payload, ensure_ascii=True))
+    return 1 if failed else 0
 
 
 def main(argv: list[str]) -> int:
     args = parse_args(argv)
+    if args.batch is not None:
+        return run_batch(args.batch, args.paranoid)
     try:
         body = read_body_file(args.body_file)
-        artifact = create_review_prompt(Path(args.repo), args.scope, body)
+        artifact = create_review_prompt(
+            Path(args.repo),
+            args.scope,
+            body,
+            paranoid=args.paranoid,
+        )
     except (OSError, UnicodeError, WriterError) as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
@@ -0,0 +1,198 @@
+"""提交缓存模块
+
+在存储目录下持久化已解析的提交记录，供 git_analyzer 增量拉取。
+
+每个（仓库路径, 作者模式）对应一个 JSON 文件，记录：
+- since：缓存已完整覆盖的起点（unix 秒，含），晚于该时间的提交都在缓存中
+- tips：写入缓存时仓库所有引用（含 HEAD）指向的对象
+- commits：git 原始提交记录（hash, message, author, date, timestamp），
+  type / is_trivial 在读取时由分类器计算，修改琐碎提交模式无需重建缓存
+
+下一次运行只需向 git 请求“新 tips 可达、旧 tips 不可达”的提交。
+
+diff 统计（增删行数、涉及文件）按提交哈希缓存在 cache/diffstats 下，
+每个仓库一个文件；提交内容不可变，条目无需失效。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.storage import get_storage_dir, write_text_atomic
+
+
+# 缓存格式版本，字段变化时递增以丢弃旧缓存
+CACHE_VERSION = 3
+DIFF_STATS_CACHE_VERSION = 1
+
+
+@dataclass
+class CommitCacheEntry:
+    repo: str
+    author: Optional[str]
+    since: int
+    tips: List[str]
+    commits: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def get_commit_cache_dir(base_dir: Optional[Path] = None) -> Path:
+    """获取提交缓存目录
+
+    Args:
+        base_dir: 存储基础目录，默认为 ~/.weekly-reports
+
+    Returns:
+        提交缓存目录路径
+    """
+    return get_storage_dir(base_dir) / "cache" / "commits"
+
+
+def get_cache_path(repo_path: Path, author: Optional[str], cache_dir: Path) -> Path:
+    """获取某个仓库与作者模式对应的缓存文件路径
+
+    Args:
+        repo_path: 仓库路径
+        author: git log --author 模式，None 表示不限作者
+        cache_dir: 提交缓存目录
+
+    Returns:
+        缓存文件路径
+    """
+    key = f"{Path(repo_path).resolve()}\0{author or ''}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{Path(repo_path).name}-{digest}.json"
+
+
+def load_commit_cache(
+    repo_path: Path,
+    author: Optional[str],
+    cache_dir: Path,
+) -> Optional[CommitCacheEntry]:
+    """读取缓存
+
+    Args:
+        repo_path: 仓库路径
+        author: git log --author 模式
+        cache_dir: 提交缓存目录
+
+    Returns:
+        缓存条目，不存在、损坏或版本不符时返回 None
+    """
+    path = get_cache_path(repo_path, author, cache_dir)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != CACHE_VERSION:
+            return None
+        entry = CommitCacheEntry(
+            repo=data["repo"],
+            author=data["author"],
+            since=int(data["since"]),
+            tips=list(data["tips"]),
+            commits=list(data["commits"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    # 文件名哈希冲突时不误用其他仓库的缓存
+    if entry.repo != str(Path(repo_path).resolve()) or entry.author != author:
+        return None
+    return entry
+
+
+def _write_json_atomic(path: Path, payload: Dict[str, Any]) -> None:
+    """原子写入 JSON，失败时静默忽略"""
+    try:
+        write_text_atomic(path, json.dumps(payload, ensure_ascii=False))
+    except OSError:
+        pass
+
+
+def save_commit_cache(entry: CommitCacheEntry, cache_dir: Path) -> None:
+    """原子写入缓存（写临时文件后替换），失败时静默忽略
+
+    Args:
+        entry: 缓存条目
+        cache_dir: 提交缓存目录
+    """
+    path = get_cache_path(Path(entry.repo), entry.author, cache_dir)
+    _write_json_atomic(path, {"version": CACHE_VERSION, **asdict(entry)})
+
+
+def get_diff_stats_cache_dir(base_dir: Optional[Path] = None) -> Path:
+    """获取 diff 统计缓存目录
+
+    Args:
+        base_dir: 存储基础目录，默认为 ~/.weekly-reports
+
+    Returns:
+        diff 统计缓存目录路径
+    """
+    return get_storage_dir(base_dir) / "cache" / "diffstats"
+
+
+def _diff_stats_path(repo_path: Path, cache_dir: Path) -> Path:
+    digest = hashlib.sha1(str(Path(repo_path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{Path(repo_path).name}-{digest}.json"
+
+
+def load_diff_stats(repo_path: Path, cache_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """读取仓库的 diff 统计缓存
+
+    Args:
+        repo_path: 仓库路径
+        cache_dir: diff 统计缓存目录
+
+    Returns:
+        提交哈希 -> {"insertions", "deletions", "files"}，无缓存时为空字典
+    """
+    try:
+        data = json.loads(_diff_stats_path(repo_path, cache_dir).read_text(encoding="utf-8"))
+        if data.get("version") != DIFF_STATS_CACHE_VERSION:
+            return {}
+        if data.get("repo") != str(Path(repo_path).resolve()):
+            return {}
+        return dict(data["stats"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save_diff_stats(repo_path: Path, stats: Dict[str, Dict[str, Any]], cache_dir: Path) -> None:
+    """原子写入仓库的 diff 统计缓存，失败时静默忽略
+
+    Args:
+        repo_path: 仓库路径
+        stats: 提交哈希 -> {"insertions", "deletions", "files"}
+        cache_dir: diff 统计缓存目录
+    """
+    payload = {
+        "version": DIFF_STATS_CACHE_VERSION,
+        "repo": str(Path(repo_path).resolve()),
+        "stats": stats,
+    }
+    _write_json_atomic(_diff_stats_path(repo_path, cache_dir), payload)
+
+
+def clear_commit_cache(base_dir: Optional[Path] = None) -> int:
+    """删除全部提交缓存与 diff 统计缓存
+
+    Args:
+        base_dir: 存储基础目录
+
+    Returns:
+        删除的缓存文件数
+    """
+    removed = 0
+    for cache_dir in (get_commit_cache_dir(base_dir), get_diff_stats_cache_dir(base_dir)):
+        if not cache_dir.exists():
+            continue
+        for path in cache_dir.glob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+    return removed
@@ -0,0 +1,181 @@
+"""提交分类模块
+
+识别琐碎提交并解析常规提交格式（type(scope): description）。
+
+用法:
+    from src.commit_classifier import CommitClassifier
+    classifier = CommitClassifier(extra_patterns=[r"^chore\\(deps\\)"])
+    classifier.classify("feat(api): add login")   # 单条
+    classifier.classify_many(messages)             # 批量，重复信息只解析一次
+
+基准测试:
+    python -m src.commit_classifier --bench
+"""
+
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# 琐碎提交的关键词
+TRIVIAL_PATTERNS = [
+    r"^fix\s*typo",
+    r"^typo",
+    r"^update\s*(readme|changelog)",
+    r"^merge\s+branch",
+    r"^merge\s+pull\s+request",
+    r"^wip$",
+    r"^wip:",
+    r"^format",
+    r"^lint",
+    r"^style:",
+]
+
+# 常规提交格式: type(scope): description
+CONVENTIONAL_PATTERN = r"^(\w+)(?:\(([^)]+)\))?\s*:\s*(.+)$"
+
+
+class CommitClassifier:
+    """把全部琐碎提交模式编译为一个分支正则，常规提交正则只编译一次
+
+    extra_patterns: 追加在 TRIVIAL_PATTERNS 之后的正则（如配置中的 trivial_patterns）
+    """
+
+    def __init__(self, extra_patterns: Optional[Iterable[str]] = None):
+        self.patterns = list(TRIVIAL_PATTERNS) + list(extra_patterns or [])
+        for pattern in self.patterns:
+            try:
+                re.compile(pattern)
+            except re.error as exc:
+                raise ValueError(f"无效的琐碎提交模式 {pattern!r}: {exc}") from exc
+
+        # 每个模式包在非捕获组中，避免 ^/$ 与 | 的优先级互相影响
+        self._trivial_re = re.compile("|".join(f"(?:{p})" for p in self.patterns), re.IGNORECASE)
+        self._conventional_re = re.compile(CONVENTIONAL_PATTERN)
+
+    def is_trivial(self, message: str) -> bool:
+        """是否为琐碎提交"""
+        return self._trivial_re.match(message.lower().strip()) is not None
+
+    def classify(self, message: str) -> Dict[str, Any]:
+        """解析提交信息
+
+        Args:
+            message: 提交信息
+
+        Returns:
+            包含 type, scope, description, is_trivial 的字典
+        """
+        is_trivial = self._trivial_re.match(message.lower().strip()) is not None
+        match = self._conventional_re.match(message)
+        if match:
+            return {
+                "type": match.group(1).lower(),
+                "scope": match.group(2),
+                "description": match.group(3),
+                "is_trivial": is_trivial,
+            }
+
+        return {
+            "type": "other",
+            "scope": None,
+            "description": message,
+            "is_trivial": is_trivial,
+        }
+
+    def classify_many(self, messages: Iterable[str]) -> List[Dict[str, Any]]:
+        """批量解析提交信息，相同的信息只解析一次（返回的字典可能被共享，勿原地修改）
+
+        Args:
+            messages: 提交信息序列
+
+        Returns:
+            与输入一一对应的解析结果列表
+        """
+        seen: Dict[str, Dict[str, Any]] = {}
+        classify = self.classify
+        results = []
+        for message in messages:
+            parsed = seen.get(message)
+            if parsed is None:
+                parsed = seen[message] = classify(message)
+            results.append(parsed)
+        return results
+
+
+DEFAULT_CLASSIFIER = CommitClassifier()
+
+
+# ============ 基准测试 ============
+def _legacy_parse(message: str) -> Dict[str, Any]:
+    """原先逐个 re.match 的实现，仅用于对比"""
+    result = {"type": "other", "scope": None, "description": message, "is_trivial": False}
+    message_lower = message.lower().strip()
+    for pattern in TRIVIAL_PATTERNS:
+        if re.match(pattern, message_lower, re.IGNORECASE):
+            result["is_trivial"] = True
+            break
+    match = re.match(CONVENTIONAL_PATTERN, message)
+    if match:
+        result["type"] = match.group(1).lower()
+        result["scope"] = match.group(2)
+        result["description"] = match.group(3)
+    return result
+
+
+def _bench_messages(count: int) -> List[str]:
+    """构造接近真实分布的提交信息：常规提交为主，夹杂琐碎与重复提交"""
+    templates = [
+        "feat(auth): add login flow {n}",
+        "fix: handle empty response in parser {n}",
+        "refactor(core): split scheduler {n}",
+        "docs: describe config options {n}",
+        "chore(deps): bump lodash to 4.17.{n}",
+        "Merge branch 'feature-{n}' into main",
+        "Merge pull request #{n} from team/topic",
+        "fix typo in README",
+        "wip",
+        "update readme",
+        "implement report export {n}",
+        "style: format code",
+    ]
+    return [templates[i % len(templates)].format(n=i % 97) for i in range(count)]
+
+
+def benchmark(count: int = 5000, repeat: int = 10) -> Dict[str, float]:
+    """对比旧实现、classify 与 classify_many 的每秒处理条数"""
+    messages = _bench_messages(count)
+    classifier = CommitClassifier()
+    paths = {
+        "legacy re.match": lambda: [_legacy_parse(m) for m in messages],
+        "classify": lambda: [classifier.classify(m) for m in messages],
+        "classify_many": lambda: classifier.classify_many(messages),
+    }
+
+    report = {}
+    for name, run in paths.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            run()
+        report[name] = count * repeat / (time.perf_counter() - start)
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="提交分类器")
+    parser.add_argument("--bench", action="store_true", help="测量每秒可分类的提交数")
+    parser.add_argument("--count", type=int, default=5000, help="基准测试的提交数（默认 5000）")
+    parser.add_argument("--repeat", type=int, default=10, help="基准测试重复次数（默认 10）")
+    parser.add_argument("message", nargs="?", help="要分类的提交信息")
+    args = parser.parse_args()
+
+    if args.bench:
+        print(f"{args.count} 条提交，重复 {args.repeat} 次")
+        for name, rate in benchmark(args.count, args.repeat).items():
+            print(f"  {name:<16} {rate:>12,.0f} 条/秒")
+    elif args.message is not None:
+        print(DEFAULT_CLASSIFIER.classify(args.message))
+    else:
+        parser.print_help()
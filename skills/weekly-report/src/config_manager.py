@@ -13,6 +13,16 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "repos": [],
     "default_author": "auto",
     "output_format": "markdown",
+    # 多仓库并发收集：线程数与单仓库超时（秒，null 表示不限制）
+    "max_workers": 8,
+    "repo_timeout": None,
+    # 在 ~/.weekly-reports/cache/commits 缓存已解析的提交，后续运行增量拉取
+    "commit_cache": True,
+    # 额外的琐碎提交正则（忽略大小写，匹配提交信息开头），追加在内置规则之后
+    "trivial_patterns": [],
+    # 为提交补充增删行数与涉及文件，单仓库时间预算（秒）
+    "diff_stats": False,
+    "diff_stats_budget": 10,
 }
 
 
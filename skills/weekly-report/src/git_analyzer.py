@@ -3,72 +3,241 @@
 提供 Git 仓库提交记录分析功能。
 """
 
+import json
+import os
 import re
 import subprocess
-from datetime import date, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.commit_cache import (
+    CommitCacheEntry,
+    get_commit_cache_dir,
+    get_diff_stats_cache_dir,
+    load_commit_cache,
+    load_diff_stats,
+    save_commit_cache,
+    save_diff_stats,
+)
+from src.commit_classifier import TRIVIAL_PATTERNS  # noqa: F401  兼容旧的导入路径
+from src.commit_classifier import DEFAULT_CLASSIFIER, CommitClassifier
+from src.config_manager import get_config_path, get_repo_paths, load_config
+from src.storage import write_text_atomic
+
+
+# 多仓库并发收集的默认线程数
+DEFAULT_MAX_WORKERS = 8
+
+# 单个仓库全部 git 调用的默认时间上限（秒），None 表示不限制
+DEFAULT_REPO_TIMEOUT: Optional[float] = None
+
+# git log 输出格式：字段以 \x1f 分隔，配合 -z 以 NUL 分隔每条提交，
+# 提交信息和作者名中的任何可见字符都不会打乱字段
+LOG_FIELD_SEPARATOR = "\x1f"
+LOG_FORMAT = "%x1f".join(["%H", "%ct", "%an", "%ad", "%s"])
+
+# 单个仓库拉取 diff 统计的默认时间预算（秒），超出后其余提交不带统计
+DEFAULT_DIFF_STATS_BUDGET: Optional[float] = 10.0
+
+# 流式读取 git log 输出时每次读取的字节数
+READ_CHUNK_SIZE = 64 * 1024
+
+# 用户身份缓存文件（与 config.json 同目录）及格式版本
+IDENTITY_CACHE_FILENAME = "identity-cache.json"
+IDENTITY_CACHE_VERSION = 1
+
+# 进程内身份缓存：仓库路径 -> {"files": {配置文件: mtime_ns}, "name": ..., "email": ...}
+_IDENTITY_CACHE: Dict[str, Dict[str, Any]] = {}
+_IDENTITY_CACHE_LOADED: Dict[str, bool] = {}
+_IDENTITY_LOCK = threading.Lock()
+
+
+def _git_config_files(repo_path: Path) -> List[Path]:
+    """可能影响仓库 user.name / user.email 的配置文件（不论是否存在）"""
+    files: List[Path] = []
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        files.append(Path(os.environ.get("GIT_CONFIG_SYSTEM") or "/etc/gitconfig"))
+
+    if os.environ.get("GIT_CONFIG_GLOBAL"):
+        files.append(Path(os.environ["GIT_CONFIG_GLOBAL"]).expanduser())
+    else:
+        xdg_home = os.environ.get("XDG_CONFIG_HOME")
+        files.append((Path(xdg_home) if xdg_home else Path.home() / ".config") / "git" / "config")
+        files.append(Path.home() / ".gitconfig")
 
+    git_dir = repo_path / ".git"
+    files.append(git_dir / "config")
+    files.append(git_dir / "config.worktree")
+    return files
 
-# 琐碎提交的关键词
-TRIVIAL_PATTERNS = [
-    r"^fix\s*typo",
-    r"^typo",
-    r"^update\s*(readme|changelog)",
-    r"^merge\s+branch",
-    r"^merge\s+pull\s+request",
-    r"^wip$",
-    r"^wip:",
-    r"^format",
-    r"^lint",
-    r"^style:",
-]
 
+def _file_mtimes(files: List[str]) -> Dict[str, Optional[int]]:
+    """配置文件的 mtime（纳秒），不存在的文件记为 None"""
+    mtimes: Dict[str, Optional[int]] = {}
+    for name in files:
+        try:
+            mtimes[name] = os.stat(name).st_mtime_ns
+        except OSError:
+            mtimes[name] = None
+    return mtimes
 
-def get_git_user(repo_path: Path) -> Optional[str]:
-    """获取 Git 用户名
 
-    Args:
-        repo_path: 仓库路径
+def _read_git_identity(repo_path: Path, timeout: Optional[float]) -> Optional[Dict[str, Any]]:
+    """用一次 git config 调用读取 user.name 与 user.email
 
     Returns:
-        用户名，未配置时返回 None
+        {"files": 配置文件 mtime, "name": ..., "email": ...}，失败时返回 None
     """
     try:
         result = subprocess.run(
-            ["git", "config", "user.name"],
+            ["git", "config", "-z", "--show-origin", "--get-regexp", r"^user\.(name|email)$"],
             cwd=repo_path,
             capture_output=True,
             text=True,
+            timeout=timeout,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-        return None
     except Exception:
         return None
 
+    # 返回 1 表示两项都未配置
+    if result.returncode not in (0, 1):
+        return None
+
+    values: Dict[str, Optional[str]] = {"name": None, "email": None}
+    files = [str(path) for path in _git_config_files(repo_path)]
+    tokens = result.stdout.split("\0")
+    for origin, entry in zip(tokens[0::2], tokens[1::2]):
+        key, _, value = entry.partition("\n")
+        # 多次配置时以最后一项为准，与 git config user.name 一致
+        field = key.split(".", 1)[-1]
+        if field in values:
+            values[field] = value.strip() or None
+        # include.path 引入的文件也纳入失效检查
+        if origin.startswith("file:"):
+            origin_path = str((repo_path / origin[len("file:"):]).resolve())
+            if origin_path not in files:
+                files.append(origin_path)
+
+    return {"files": _file_mtimes(files), **values}
+
+
+def _identity_cache_path() -> Path:
+    return get_config_path().parent / IDENTITY_CACHE_FILENAME
+
+
+def _is_identity_entry(entry: Any) -> bool:
+    """检查持久化的身份缓存条目结构：files 为 {路径: mtime}，name / email 为字符串或 None"""
+    if not isinstance(entry, dict) or not isinstance(entry.get("files"), dict):
+        return False
+    if not all(
+        isinstance(name, str) and (mtime is None or isinstance(mtime, int))
+        for name, mtime in entry["files"].items()
+    ):
+        return False
+    return all(
+        field in entry and (entry[field] is None or isinstance(entry[field], str))
+        for field in ("name", "email")
+    )
+
+
+def _load_identity_cache(cache_path: Path) -> None:
+    """把持久化的身份缓存读入进程缓存（每个文件只读一次，调用方持有锁）
+
+    结构不完整的条目直接跳过，对应仓库按未缓存处理，重新调用 git config。
+    """
+    if _IDENTITY_CACHE_LOADED.get(str(cache_path)):
+        return
+    _IDENTITY_CACHE_LOADED[str(cache_path)] = True
+
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        if data.get("version") != IDENTITY_CACHE_VERSION:
+            return
+        for repo, entry in data.get("repos", {}).items():
+            if _is_identity_entry(entry):
+                _IDENTITY_CACHE.setdefault(repo, entry)
+    except (OSError, ValueError, AttributeError):
+        return
+
+
+def _save_identity_cache(cache_path: Path) -> None:
+    """原子写入身份缓存（调用方持有锁），失败时静默忽略"""
+    payload = {"version": IDENTITY_CACHE_VERSION, "repos": _IDENTITY_CACHE}
+    try:
+        write_text_atomic(cache_path, json.dumps(payload, ensure_ascii=False))
+    except OSError:
+        pass
+
+
+def get_git_identity(
+    repo_path: Path,
+    timeout: Optional[float] = None,
+    cache_path: Optional[Path] = None,
+) -> Dict[str, Optional[str]]:
+    """获取仓库生效的 Git 用户名与邮箱
+
+    结果缓存在进程内，并持久化到 config.json 同目录的 identity-cache.json；
+    相关配置文件（系统、全局、仓库及 include 引入的文件）的 mtime 不变时
+    直接使用缓存，不启动子进程。
+
+    Args:
+        repo_path: 仓库路径
+        timeout: git 子进程超时（秒），None 表示不限制
+        cache_path: 持久化缓存文件，默认为 ~/.weekly-reports/identity-cache.json
+
+    Returns:
+        {"name": 用户名, "email": 邮箱}，未配置或失败的项为 None
+    """
+    repo_key = str(Path(repo_path).resolve())
+    if cache_path is None:
+        cache_path = _identity_cache_path()
+
+    with _IDENTITY_LOCK:
+        _load_identity_cache(cache_path)
+        entry = _IDENTITY_CACHE.get(repo_key)
+
+    if entry is not None and _file_mtimes(list(entry["files"])) == entry["files"]:
+        return {"name": entry["name"], "email": entry["email"]}
+
+    entry = _read_git_identity(Path(repo_path), timeout)
+    if entry is None:
+        return {"name": None, "email": None}
+
+    with _IDENTITY_LOCK:
+        _IDENTITY_CACHE[repo_key] = entry
+        _save_identity_cache(cache_path)
+
+    return {"name": entry["name"], "email": entry["email"]}
 
-def get_git_user_email(repo_path: Path) -> Optional[str]:
+
+def get_git_user(repo_path: Path, timeout: Optional[float] = None) -> Optional[str]:
+    """获取 Git 用户名
+
+    Args:
+        repo_path: 仓库路径
+        timeout: git 子进程超时（秒），None 表示不限制
+
+    Returns:
+        用户名，未配置或超时时返回 None
+    """
+    return get_git_identity(repo_path, timeout=timeout)["name"]
+
+
+def get_git_user_email(repo_path: Path, timeout: Optional[float] = None) -> Optional[str]:
     """获取 Git 用户邮箱
 
     Args:
         repo_path: 仓库路径
+        timeout: git 子进程超时（秒），None 表示不限制
 
     Returns:
-        邮箱，未配置时返回 None
+        邮箱，未配置或超时时返回 None
     """
-    try:
-        result = subprocess.run(
-            ["git", "config", "user.email"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-        return None
-    except Exception:
-        return None
+    return get_git_identity(repo_path, timeout=timeout)["email"]
 
 
 def _escape_git_author_pattern(value: str) -> str:
@@ -94,11 +263,53 @@ def build_author_pattern(
     return "(" + "|".join(parts) + ")"
 
 
+def iter_commits(
+    repo_path: Path,
+    start_date: date,
+    end_date: date,
+    author: Optional[str] = None,
+    timeout: Optional[float] = None,
+    classifier: Optional[CommitClassifier] = None,
+) -> Iterator[Dict[str, Any]]:
+    """流式读取指定日期范围内的提交记录
+
+    边读取 git log 输出边解析，内存占用与提交数量无关。
+
+    Args:
+        repo_path: 仓库路径
+        start_date: 开始日期
+        end_date: 结束日期
+        author: 作者名（可选）
+        timeout: git 子进程超时（秒），None 表示不限制
+        classifier: 提交分类器，默认为 DEFAULT_CLASSIFIER
+
+    Yields:
+        提交记录
+
+    Raises:
+        subprocess.TimeoutExpired: 超时（已产出的提交不完整）
+        subprocess.CalledProcessError: git log 执行失败
+    """
+    since, until = _window_bounds(start_date, end_date)
+    project = get_repo_name(repo_path)
+    classifier = classifier or DEFAULT_CLASSIFIER
+    records = _iter_log_records(
+        repo_path,
+        ["--all", f"--since=@{since}", f"--until=@{until}"],
+        author,
+        timeout,
+    )
+    for record in records:
+        yield _to_commit(record, project, classifier.classify(record["message"]))
+
+
 def get_commits(
     repo_path: Path,
     start_date: date,
     end_date: date,
     author: Optional[str] = None,
+    timeout: Optional[float] = None,
+    classifier: Optional[CommitClassifier] = None,
 ) -> List[Dict[str, Any]]:
     """获取指定日期范围内的提交记录
 
@@ -107,60 +318,432 @@ def get_commits(
         start_date: 开始日期
         end_date: 结束日期
         author: 作者名（可选）
+        timeout: git 子进程超时（秒），None 表示不限制；超时返回空列表
+        classifier: 提交分类器，默认为 DEFAULT_CLASSIFIER
 
     Returns:
         提交记录列表
     """
-    # git log 的 --until=YYYY-MM-DD 会被解析为当天 00:00:00，
-    # 可能导致“结束日当天”的提交被排除；这里将截止时间调整到下一天 00:00。
-    end_date_exclusive = end_date + timedelta(days=1)
-
-    # 构建 git log 命令
-    cmd = [
-        "git",
-        "log",
-        "--all",
-        f"--since={start_date.isoformat()}",
-        f"--until={end_date_exclusive.isoformat()}",
-        "--pretty=format:%H|%s|%an|%ad",
-        "--date=short",
-    ]
+    try:
+        return list(iter_commits(repo_path, start_date, end_date, author, timeout, classifier))
+    except Exception:
+        return []
+
+
+def _window_bounds(start_date: date, end_date: date) -> Tuple[int, int]:
+    """日期范围对应的闭区间 unix 时间戳（本地时区，含结束日当天）
+
+    git 会把 --since=YYYY-MM-DD 解析为“该日的当前时刻”，这里显式取当天
+    00:00:00 到结束日 23:59:59，缓存与直接查询使用同一边界。
+    """
+    since = datetime.combine(start_date, datetime.min.time()).timestamp()
+    until = datetime.combine(end_date + timedelta(days=1), datetime.min.time()).timestamp()
+    return int(since), int(until) - 1
+
 
+def _parse_log_record(raw: bytes) -> Optional[Dict[str, Any]]:
+    """解析一条 LOG_FORMAT 格式的 git log 记录"""
+    parts = raw.decode("utf-8", errors="replace").split(LOG_FIELD_SEPARATOR)
+    if len(parts) != 5:
+        return None
+
+    return {
+        "hash": parts[0].strip(),
+        "message": parts[4],
+        "author": parts[2],
+        "date": parts[3],
+        "timestamp": int(parts[1]),
+    }
+
+
+def _iter_git_output(
+    cmd: List[str],
+    repo_path: Path,
+    timeout: Optional[float],
+    stdin: Optional[str] = None,
+    separator: bytes = b"\0",
+) -> Iterator[bytes]:
+    """流式执行 git 命令，按 separator 切分 stdout 逐条产出
+
+    超时由计时器终止子进程；生成器提前关闭时子进程也会被回收。
+
+    Raises:
+        subprocess.TimeoutExpired: 超时
+        subprocess.CalledProcessError: git 执行失败
+    """
+    process = subprocess.Popen(
+        cmd,
+        cwd=repo_path,
+        stdin=subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    expired = threading.Event()
+
+    def _expire() -> None:
+        expired.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, _expire) if timeout is not None else None
+    try:
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+        if stdin is not None:
+            process.stdin.write(stdin.encode("utf-8"))
+            process.stdin.close()
+
+        pending = b""
+        for chunk in iter(lambda: process.stdout.read1(READ_CHUNK_SIZE), b""):
+            *complete, pending = (pending + chunk).split(separator)
+            yield from complete
+        if pending:
+            yield pending
+
+        returncode = process.wait()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _iter_log_records(
+    repo_path: Path,
+    args: List[str],
+    author: Optional[str],
+    timeout: Optional[float],
+    stdin: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """执行 git log 并流式解析为原始提交记录（hash, message, author, date, timestamp）
+
+    Raises:
+        subprocess.TimeoutExpired: 超时
+        subprocess.CalledProcessError: git log 执行失败
+    """
+    cmd = ["git", "log", "-z", *args, f"--pretty=format:{LOG_FORMAT}", "--date=short"]
     if author:
-        cmd.append(f"--author={author}")
+        # build_author_pattern 生成的是扩展正则 "(name|email)"，
+        # 默认的基础正则会把括号和 | 当作字面量，导致匹配不到任何提交
+        cmd.extend(["--extended-regexp", f"--author={author}"])
+
+    for raw in _iter_git_output(cmd, repo_path, timeout, stdin):
+        record = _parse_log_record(raw)
+        if record is not None:
+            yield record
+
+
+def _run_git_log(
+    repo_path: Path,
+    args: List[str],
+    author: Optional[str],
+    timeout: Optional[float],
+    stdin: Optional[str] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """执行 git log 并解析为提交记录列表，git 调用失败或超时时返回 None"""
+    try:
+        return list(_iter_log_records(repo_path, args, author, timeout, stdin))
+    except Exception:
+        return None
+
+
+def _to_commit(record: Dict[str, Any], project: str, parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """把内部记录与分类结果组合为对外的提交字典"""
+    return {
+        "hash": record["hash"],
+        "message": record["message"],
+        "author": record["author"],
+        "date": record["date"],
+        "type": parsed["type"],
+        "is_trivial": parsed["is_trivial"],
+        "project": project,
+    }
 
+
+def get_ref_tips(repo_path: Path, timeout: Optional[float] = None) -> Optional[List[str]]:
+    """获取仓库所有引用（含 HEAD）指向的对象，即 git log --all 的起点
+
+    Args:
+        repo_path: 仓库路径
+        timeout: git 子进程超时（秒），None 表示不限制
+
+    Returns:
+        去重排序后的对象哈希列表，失败时返回 None
+    """
     try:
         result = subprocess.run(
-            cmd,
+            ["git", "show-ref", "--head", "--hash"],
             cwd=repo_path,
             capture_output=True,
             text=True,
+            timeout=timeout,
         )
+    except Exception:
+        return None
+
+    # 空仓库没有任何引用，show-ref 返回 1 且无输出
+    if result.returncode not in (0, 1):
+        return None
+    return sorted(set(result.stdout.split()))
 
-        if result.returncode != 0 or not result.stdout.strip():
-            return []
 
-        commits = []
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-
-            parts = line.split("|")
-            if len(parts) >= 4:
-                parsed = parse_commit_message(parts[1])
-                commits.append({
-                    "hash": parts[0],
-                    "message": parts[1],
-                    "author": parts[2],
-                    "date": parts[3],
-                    "type": parsed["type"],
-                    "is_trivial": parsed["is_trivial"],
-                    "project": get_repo_name(repo_path),
-                })
-
-        return commits
+def _count_unreachable(
+    repo_path: Path,
+    tips: List[str],
+    exclude: List[str],
+    since: int,
+    timeout: Optional[float],
+) -> Optional[int]:
+    """统计 since 之后从 tips 可达、从 exclude 不可达的提交数，失败时返回 None"""
+    revs = list(tips) + [f"^{tip}" for tip in exclude]
+    try:
+        result = subprocess.run(
+            ["git", "rev-list", "--count", "--stdin", f"--since=@{since}"],
+            cwd=repo_path,
+            input="\n".join(revs) + "\n",
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        if result.returncode != 0:
+            return None
+        return int(result.stdout.strip() or 0)
     except Exception:
-        return []
+        return None
+
+
+def _refresh_cached_records(
+    repo_path: Path,
+    entry: CommitCacheEntry,
+    tips: List[str],
+    author: Optional[str],
+    deadline: Optional[float],
+) -> Optional[List[Dict[str, Any]]]:
+    """按引用变化增量更新缓存的提交记录
+
+    Returns:
+        更新后的记录列表；引用被删除或改写（缓存里可能有已不可达的提交）
+        或 git 调用失败时返回 None，由调用方回退到全量拉取
+    """
+    old_tips, new_tips = set(entry.tips), set(tips)
+    if old_tips == new_tips:
+        return entry.commits
+
+    removed = sorted(old_tips - new_tips)
+    if removed:
+        # 旧 tip 只是前移时，它仍可从新 tips 到达
+        lost = _count_unreachable(repo_path, removed, tips, entry.since, _remaining(deadline))
+        if lost != 0:
+            return None
+
+    added = sorted(new_tips - old_tips)
+    if not added:
+        return entry.commits
+
+    revs = added + [f"^{tip}" for tip in entry.tips]
+    fresh = _run_git_log(
+        repo_path,
+        ["--stdin", f"--since=@{entry.since}"],
+        author,
+        _remaining(deadline),
+        stdin="\n".join(revs) + "\n",
+    )
+    if fresh is None:
+        return None
+
+    known = {record["hash"] for record in entry.commits}
+    fresh = [record for record in fresh if record["hash"] not in known]
+    return sorted(fresh + entry.commits, key=lambda record: record["timestamp"], reverse=True)
+
+
+def get_commits_cached(
+    repo_path: Path,
+    start_date: date,
+    end_date: date,
+    author: Optional[str] = None,
+    timeout: Optional[float] = None,
+    cache_dir: Optional[Path] = None,
+    classifier: Optional[CommitClassifier] = None,
+) -> List[Dict[str, Any]]:
+    """获取指定日期范围内的提交记录，使用磁盘缓存增量拉取
+
+    缓存按仓库路径与作者模式区分，记录上次的引用 tips 与覆盖起点。
+    引用未变化时不再调用 git log；有新提交时只拉取新 tips 可达、
+    旧 tips 不可达的部分；请求范围早于覆盖起点或历史被改写时全量拉取。
+
+    Args:
+        repo_path: 仓库路径
+        start_date: 开始日期
+        end_date: 结束日期
+        author: 作者匹配模式（可选）
+        timeout: 该仓库全部 git 调用的时间上限（秒），None 表示不限制
+        cache_dir: 缓存目录，默认为 ~/.weekly-reports/cache/commits
+        classifier: 提交分类器，默认为 DEFAULT_CLASSIFIER；分类在读取时进行，
+            缓存中只保存 git 原始字段，修改琐碎提交模式无需重建缓存
+
+    Returns:
+        提交记录列表，与 get_commits 的结果一致
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    since, until = _window_bounds(start_date, end_date)
+
+    tips = get_ref_tips(repo_path, timeout=_remaining(deadline))
+    if tips is None:
+        return get_commits(repo_path, start_date, end_date, author, _remaining(deadline), classifier)
+
+    if cache_dir is None:
+        cache_dir = get_commit_cache_dir()
+
+    entry = load_commit_cache(repo_path, author, cache_dir)
+    records: Optional[List[Dict[str, Any]]] = None
+    if entry is not None and entry.since <= since:
+        records = _refresh_cached_records(repo_path, entry, tips, author, deadline)
+        if records is not None and entry.tips != tips:
+            entry.tips, entry.commits = tips, records
+            save_commit_cache(entry, cache_dir)
+
+    if records is None:
+        # 不设上限，让缓存覆盖 since 之后的全部提交
+        records = _run_git_log(repo_path, ["--all", f"--since=@{since}"], author, _remaining(deadline))
+        if records is None:
+            return []
+        entry = CommitCacheEntry(
+            repo=str(Path(repo_path).resolve()),
+            author=author,
+            since=since,
+            tips=tips,
+            commits=records,
+        )
+        save_commit_cache(entry, cache_dir)
+
+    records = [record for record in records if since <= record["timestamp"] <= until]
+    parsed = (classifier or DEFAULT_CLASSIFIER).classify_many(record["message"] for record in records)
+    project = get_repo_name(repo_path)
+    return [_to_commit(record, project, info) for record, info in zip(records, parsed)]
+
+
+def _parse_numstat_record(raw: bytes) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """解析一条 numstat 记录（哈希、NUL、numstat -z 输出），返回 (哈希, 统计)"""
+    header, _, body = raw.partition(b"\0")
+    commit_hash = header.decode("ascii", errors="replace").strip()
+    if not commit_hash:
+        return None
+
+    insertions = deletions = 0
+    files: List[str] = []
+    tokens = iter(body.split(b"\0"))
+    for token in tokens:
+        token = token.lstrip(b"\n")
+        if not token:
+            continue
+        fields = token.decode("utf-8", errors="replace").split("\t", 2)
+        if len(fields) != 3:
+            continue
+        added, deleted, path = fields
+        if not path:
+            # 重命名时路径为空，随后两项依次是旧路径和新路径
+            next(tokens, b"")
+            path = next(tokens, b"").decode("utf-8", errors="replace")
+        # 二进制文件显示为 "-"，不计入行数
+        insertions += int(added) if added.isdigit() else 0
+        deletions += int(deleted) if deleted.isdigit() else 0
+        files.append(path)
+
+    return commit_hash, {"insertions": insertions, "deletions": deletions, "files": files}
+
+
+def get_diff_stats(
+    repo_path: Path,
+    hashes: List[str],
+    timeout: Optional[float] = DEFAULT_DIFF_STATS_BUDGET,
+    cache_dir: Optional[Path] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """获取提交的增删行数与涉及文件
+
+    未缓存的提交通过一次 git log --no-walk --stdin --numstat 批量获取，
+    结果按哈希缓存。超出时间预算时保留已完整读取的部分。
+
+    Args:
+        repo_path: 仓库路径
+        hashes: 提交哈希列表
+        timeout: 时间预算（秒），None 表示不限制
+        cache_dir: 缓存目录，默认为 ~/.weekly-reports/cache/diffstats
+
+    Returns:
+        提交哈希 -> {"insertions", "deletions", "files"}，未取到的提交不在其中
+    """
+    if cache_dir is None:
+        cache_dir = get_diff_stats_cache_dir()
+
+    stats = load_diff_stats(repo_path, cache_dir)
+    missing = [commit_hash for commit_hash in dict.fromkeys(hashes) if commit_hash not in stats]
+    if missing:
+        cmd = ["git", "log", "--no-walk=unsorted", "--stdin", "--numstat", "-z", "--format=%x1e%H"]
+        fetched = 0
+        previous: Optional[bytes] = None
+
+        def _collect(raw: bytes) -> int:
+            parsed = _parse_numstat_record(raw)
+            if parsed is None:
+                return 0
+            stats[parsed[0]] = parsed[1]
+            return 1
+
+        try:
+            records = _iter_git_output(cmd, repo_path, timeout, "\n".join(missing) + "\n", separator=b"\x1e")
+            # 下一条记录开始时上一条才算完整；超时被截断的最后一条直接丢弃
+            for raw in records:
+                if previous is not None:
+                    fetched += _collect(previous)
+                previous = raw
+            if previous is not None:
+                fetched += _collect(previous)
+        except Exception:
+            pass
+
+        if fetched:
+            save_diff_stats(repo_path, stats, cache_dir)
+
+    return {commit_hash: stats[commit_hash] for commit_hash in hashes if commit_hash in stats}
+
+
+def enrich_commits(
+    repo_path: Path,
+    commits: List[Dict[str, Any]],
+    timeout: Optional[float] = DEFAULT_DIFF_STATS_BUDGET,
+    cache_dir: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """为提交补充 diff 统计字段（原地修改）
+
+    补充 insertions、deletions、lines（两者之和）与 files（涉及路径）；
+    超出时间预算未取到统计的提交保持原样。
+
+    Args:
+        repo_path: 仓库路径
+        commits: 提交记录列表
+        timeout: 时间预算（秒），None 表示不限制
+        cache_dir: 缓存目录，默认为 ~/.weekly-reports/cache/diffstats
+
+    Returns:
+        传入的提交列表
+    """
+    stats = get_diff_stats(repo_path, [commit["hash"] for commit in commits], timeout, cache_dir)
+    for commit in commits:
+        stat = stats.get(commit["hash"])
+        if stat is None:
+            continue
+        commit["insertions"] = stat["insertions"]
+        commit["deletions"] = stat["deletions"]
+        commit["lines"] = stat["insertions"] + stat["deletions"]
+        commit["files"] = list(stat["files"])
+    return commits
 
 
 def group_commits_by_project(
@@ -194,32 +777,7 @@ def parse_commit_message(message: str) -> Dict[str, Any]:
     Returns:
         解析后的提交信息字典
     """
-    result = {
-        "type": "other",
-        "scope": None,
-        "description": message,
-        "is_trivial": False,
-    }
-
-    # 检查是否为琐碎提交
-    message_lower = message.lower().strip()
-    for pattern in TRIVIAL_PATTERNS:
-        if re.match(pattern, message_lower, re.IGNORECASE):
-            result["is_trivial"] = True
-            break
-
-    # 解析常规提交格式: type(scope): description
-    conventional_pattern = r"^(\w+)(?:\(([^)]+)\))?\s*:\s*(.+)$"
-    match = re.match(conventional_pattern, message)
-
-    if match:
-        result["type"] = match.group(1).lower()
-        result["scope"] = match.group(2)
-        result["description"] = match.group(3)
-    else:
-        result["description"] = message
-
-    return result
+    return DEFAULT_CLASSIFIER.classify(message)
 
 
 def is_git_repo(path: Path) -> bool:
@@ -299,44 +857,167 @@ def merge_commits_from_repos(
     return merged
 
 
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """距截止时间的剩余秒数（至少留 0.1 秒，让超时由子进程抛出）"""
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.1)
+
+
+def _collect_repo_commits(
+    path: Path,
+    start_date: date,
+    end_date: date,
+    author: Optional[str],
+    timeout: Optional[float],
+    use_cache: bool = True,
+    cache_dir: Optional[Path] = None,
+    classifier: Optional[CommitClassifier] = None,
+    diff_stats: bool = False,
+    diff_stats_budget: Optional[float] = DEFAULT_DIFF_STATS_BUDGET,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """收集单个仓库的提交记录，timeout 为该仓库所有 git 调用的总时间上限
+
+    Returns:
+        (提交记录, 是否超时)；超时时提交记录可能不完整
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    # 如果没有指定作者，自动获取
+    current_author = author
+    if current_author is None:
+        identity = get_git_identity(path, timeout=_remaining(deadline))
+        current_author = build_author_pattern(
+            user_name=identity["name"],
+            user_email=identity["email"],
+        )
+
+    if use_cache:
+        commits = get_commits_cached(
+            path, start_date, end_date, current_author, _remaining(deadline), cache_dir, classifier,
+        )
+    else:
+        commits = get_commits(path, start_date, end_date, current_author, _remaining(deadline), classifier)
+    timed_out = deadline is not None and time.monotonic() >= deadline
+
+    if diff_stats and commits:
+        budget = _remaining(deadline)
+        if diff_stats_budget is not None:
+            budget = diff_stats_budget if budget is None else min(budget, diff_stats_budget)
+        enrich_commits(path, commits, timeout=budget)
+
+    return commits, timed_out
+
+
 def get_all_commits_from_repos(
     repo_paths: List[Path],
     start_date: date,
     end_date: date,
     author: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = DEFAULT_REPO_TIMEOUT,
+    use_cache: bool = True,
+    cache_dir: Optional[Path] = None,
+    trivial_patterns: Optional[List[str]] = None,
+    diff_stats: bool = False,
+    diff_stats_budget: Optional[float] = DEFAULT_DIFF_STATS_BUDGET,
+    timed_out: Optional[List[str]] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """从多个仓库获取提交记录
 
+    各仓库在有界线程池中并发收集，结果按 repo_paths 的顺序合并，
+    与串行执行的输出一致。
+
     Args:
         repo_paths: 仓库路径列表
         start_date: 开始日期
         end_date: 结束日期
         author: 作者名（可选，None 表示自动获取）
+        max_workers: 并发线程数，默认 DEFAULT_MAX_WORKERS；1 表示串行
+        timeout: 单个仓库的时间上限（秒），默认不限制；超时仓库的提交可能不完整
+        use_cache: 是否使用磁盘提交缓存增量拉取（见 get_commits_cached）
+        cache_dir: 缓存目录，默认为 ~/.weekly-reports/cache/commits
+        trivial_patterns: 额外的琐碎提交正则（配置中的 trivial_patterns）
+        diff_stats: 是否补充增删行数与涉及文件（见 enrich_commits）
+        diff_stats_budget: 单个仓库拉取 diff 统计的时间预算（秒），None 表示不限制
+        timed_out: 可选列表，按 repo_paths 顺序追加超时的仓库名，供报告标注
 
     Returns:
         按仓库分组的提交记录
     """
-    commits_by_repo: Dict[str, List[Dict[str, Any]]] = {}
-
+    repos: List[Tuple[str, Path]] = []
     for path in repo_paths:
         if isinstance(path, str):
             path = Path(path)
 
-        if not is_git_repo(path):
-            continue
+        if is_git_repo(path):
+            repos.append((get_repo_name(path), path))
+
+    if not repos:
+        return {}
+
+    classifier = CommitClassifier(trivial_patterns) if trivial_patterns else DEFAULT_CLASSIFIER
+    workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, len(repos)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            (repo_name, pool.submit(
+                _collect_repo_commits,
+                path, start_date, end_date, author, timeout, use_cache, cache_dir, classifier,
+                diff_stats, diff_stats_budget,
+            ))
+            for repo_name, path in repos
+        ]
+
+        commits_by_repo: Dict[str, List[Dict[str, Any]]] = {}
+        for repo_name, future in futures:
+            commits, repo_timed_out = future.result()
+            if repo_timed_out and timed_out is not None:
+                timed_out.append(repo_name)
+            if commits:
+                commits_by_repo[repo_name] = commits
 
-        # 如果没有指定作者，自动获取
-        current_author = author
-        if current_author is None:
-            current_author = build_author_pattern(
-                user_name=get_git_user(path),
-                user_email=get_git_user_email(path),
-            )
+    return commits_by_repo
 
-        repo_name = get_repo_name(path)
-        commits = get_commits(path, start_date, end_date, current_author)
 
-        if commits:
-            commits_by_repo[repo_name] = commits
+def get_all_commits_from_config(
+    start_date: date,
+    end_date: date,
+    author: Optional[str] = None,
+    repo_paths: Optional[List[Path]] = None,
+    config: Optional[Dict[str, Any]] = None,
+    timed_out: Optional[List[str]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """按配置文件中的设置从多个仓库获取提交记录
 
-    return commits_by_repo
+    读取 max_workers、repo_timeout、commit_cache、trivial_patterns、diff_stats、
+    diff_stats_budget 并传给 get_all_commits_from_repos。
+
+    Args:
+        start_date: 开始日期
+        end_date: 结束日期
+        author: 作者名（可选，None 表示自动获取）
+        repo_paths: 仓库路径列表，默认为配置中的全部仓库
+        config: 配置字典，默认读取 ~/.weekly-reports/config.json
+        timed_out: 可选列表，追加超时的仓库名
+
+    Returns:
+        按仓库分组的提交记录
+    """
+    if config is None:
+        config = load_config()
+    if repo_paths is None:
+        repo_paths = get_repo_paths(config)
+
+    return get_all_commits_from_repos(
+        repo_paths,
+        start_date,
+        end_date,
+        author,
+        max_workers=config.get("max_workers"),
+        timeout=config.get("repo_timeout"),
+        use_cache=config.get("commit_cache", True),
+        trivial_patterns=config.get("trivial_patterns"),
+        diff_stats=config.get("diff_stats", False),
+        diff_stats_budget=config.get("diff_stats_budget", DEFAULT_DIFF_STATS_BUDGET),
+        timed_out=timed_out,
+    )
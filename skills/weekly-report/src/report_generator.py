@@ -4,20 +4,43 @@
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from datetime import date
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from src.git_analyzer import group_commits_by_project
 
 
+# 合并相关提交所需的默认关键词 Jaccard 相似度，1.0 表示只合并关键词集合完全相同的提交
+DEFAULT_MERGE_SIMILARITY = 1.0
+
+# 按相似度合并时忽略的泛用动词与名词（"add login page" 与 "add logout page" 不因此相关）
+GENERIC_KEYWORDS = frozenset({
+    "add", "added", "adds", "fix", "fixed", "fixes", "update", "updated", "updates",
+    "remove", "removed", "delete", "change", "changed", "improve", "refactor",
+    "support", "use", "make", "new", "more", "some", "minor", "page", "pages",
+    "file", "files", "code", "test", "tests", "bug", "bugs", "issue", "feature",
+    "新增", "添加", "修复", "更新", "优化", "调整", "删除", "修改", "问题", "功能", "页面",
+})
+
+# 倒排索引中每个关键词最多检查的候选分组数（取最近的分组），保证大量提交时接近线性
+MERGE_CANDIDATES_PER_KEYWORD = 64
+
+
 def generate_report(
     commits: List[Dict[str, Any]],
     supplements: Optional[List[str]] = None,
+    show_stats: bool = False,
+    merge_across_projects: bool = False,
+    merge_across_weeks: bool = True,
 ) -> str:
     """生成周报
 
     Args:
         commits: 提交记录列表
         supplements: 补充内容列表
+        show_stats: 是否在工作点后附上改动规模（需先用 enrich_commits 补充统计）
+        merge_across_projects: 是否跨项目合并相关提交，合并后的条目归入主条目所属项目
+        merge_across_weeks: 是否跨周合并相关提交（时间段报告可关闭，按周分别合并）
 
     Returns:
         Markdown 格式的周报内容
@@ -28,18 +51,26 @@ def generate_report(
     # 过滤琐碎提交
     filtered_commits = filter_trivial_commits(commits)
 
-    # 按项目分组
-    grouped = group_commits_by_project(filtered_commits)
-
     # 生成周报内容
     sections = []
 
-    # 按项目生成各部分
-    for project, project_commits in sorted(grouped.items()):
-        # 合并相关提交
-        merged = merge_related_commits(project_commits)
-        section = format_project_section(project, merged)
-        sections.append(section)
+    if merge_across_projects:
+        # 先整体合并，再按主条目所属项目分组
+        merged_all = merge_related_commits(
+            filtered_commits, across_projects=True, across_weeks=merge_across_weeks,
+        )
+        for project, merged in sorted(group_commits_by_project(merged_all).items()):
+            sections.append(format_project_section(project, merged, show_stats))
+    else:
+        # 按项目分组
+        grouped = group_commits_by_project(filtered_commits)
+
+        # 按项目生成各部分
+        for project, project_commits in sorted(grouped.items()):
+            # 合并相关提交
+            merged = merge_related_commits(project_commits, across_weeks=merge_across_weeks)
+            section = format_project_section(project, merged, show_stats)
+            sections.append(section)
 
     # 添加"其他"部分（补充内容）
     if supplements:
@@ -69,8 +100,20 @@ def filter_trivial_commits(
     return [c for c in commits if not c.get("is_trivial", False)]
 
 
+def _commit_week(commit: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """提交所在的 ISO (年, 周)，日期缺失或无效时返回 None"""
+    try:
+        iso = date.fromisoformat(str(commit.get("date", ""))[:10]).isocalendar()
+    except ValueError:
+        return None
+    return iso[0], iso[1]
+
+
 def merge_related_commits(
-    commits: List[Dict[str, Any]]
+    commits: List[Dict[str, Any]],
+    similarity: float = DEFAULT_MERGE_SIMILARITY,
+    across_projects: bool = False,
+    across_weeks: bool = True,
 ) -> List[Dict[str, Any]]:
     """合并相关提交
 
@@ -78,11 +121,24 @@ def merge_related_commits(
     - 同一功能的多次迭代合并为一条
     - 问题排查和解决归为一条
 
+    默认只合并关键词集合完全相同的提交。similarity 小于 1.0 时先去掉
+    GENERIC_KEYWORDS 中的泛用词，再以关键词集合的 Jaccard 相似度判断相关：
+    每个提交与已有分组的首个提交比较，相似度不低于 similarity 时并入其中最相似
+    （相同时取最早）的分组。候选分组通过关键词倒排索引查找，每个关键词只检查
+    最近 MERGE_CANDIDATES_PER_KEYWORD 个分组，整体接近线性。没有关键词的提交
+    仅与清理后信息完全相同的提交合并。
+
+    提交带有 diff 统计（enrich_commits）时，合并后的条目汇总同组的
+    insertions / deletions / lines，files 为同组涉及路径的有序并集。
+
     Args:
         commits: 提交记录列表
+        similarity: 合并所需的最小 Jaccard 相似度，默认 1.0 表示关键词集合完全相同
+        across_projects: 是否允许不同项目的提交合并（合并后的条目带 projects 字段）
+        across_weeks: 是否允许不同 ISO 周的提交合并
 
     Returns:
-        合并后的提交列表
+        合并后的提交列表，顺序为各分组首个提交的出现顺序
     """
     if not commits:
         return []
@@ -91,55 +147,103 @@ def merge_related_commits(
         single.setdefault("details", [])
         return [single]
 
-    # 按关键词分组
-    groups: Dict[str, List[Dict[str, Any]]] = {}
-
-    for commit in commits:
-        # 提取关键词
-        keywords = extract_keywords(commit["message"])
-        key = frozenset(keywords) if keywords else commit["message"]
-
-        # 转换为字符串 key
-        str_key = str(sorted(keywords)) if keywords else commit["message"]
-
-        if str_key not in groups:
-            groups[str_key] = []
-        groups[str_key].append(commit)
-
-    # 合并同组提交（保留主条目 + 子条目细节，避免信息丢失）
+    # 每个分组：首个提交的关键词集合、成员下标、主条目下标（首个 feat，否则首个提交）
+    leaders: List[FrozenSet[str]] = []
+    members: List[List[int]] = []
+    mains: List[int] = []
+    index: Dict[Tuple[Any, str], List[int]] = {}
+    same_leader: Dict[Tuple[Any, FrozenSet[str]], int] = {}
+    exact: Dict[Tuple[Any, str], int] = {}
+    keyword_sets: Dict[str, FrozenSet[str]] = {}
+    fuzzy = similarity < 1.0
+
+    for position, commit in enumerate(commits):
+        message = commit.get("message", "")
+        scope = (
+            None if across_projects else commit.get("project"),
+            None if across_weeks else _commit_week(commit),
+        )
+        keywords = keyword_sets.get(message)
+        if keywords is None:
+            keywords = keyword_sets[message] = frozenset(extract_keywords(message, drop_generic=fuzzy))
+
+        # 关键词集合完全相同的分组相似度为 1，直接命中
+        group: Optional[int] = same_leader.get((scope, keywords)) if keywords else None
+        if keywords and group is None and fuzzy:
+            shared: Dict[int, int] = {}
+            for keyword in keywords:
+                for candidate in index.get((scope, keyword), ())[-MERGE_CANDIDATES_PER_KEYWORD:]:
+                    shared[candidate] = shared.get(candidate, 0) + 1
+            best = 0.0
+            for candidate, overlap in shared.items():
+                score = overlap / (len(keywords) + len(leaders[candidate]) - overlap)
+                if score < similarity:
+                    continue
+                if group is None or score > best or (score == best and candidate < group):
+                    group, best = candidate, score
+        elif not keywords:
+            group = exact.get((scope, clean_commit_message(message)))
+
+        if group is None:
+            group = len(leaders)
+            leaders.append(keywords)
+            members.append([])
+            mains.append(position)
+            if keywords:
+                same_leader[(scope, keywords)] = group
+                for keyword in keywords:
+                    index.setdefault((scope, keyword), []).append(group)
+            else:
+                exact[(scope, clean_commit_message(message))] = group
+        elif commit.get("type") == "feat" and commits[mains[group]].get("type") != "feat":
+            mains[group] = position
+        members[group].append(position)
+
+    # 合并同组提交（保留主条目 + 子条目细节，避免信息丢失）；每个分组只复制一次主条目
     merged: List[Dict[str, Any]] = []
-    for group_commits in groups.values():
-        main_commit = group_commits[0].copy()
-        for c in group_commits:
-            if c.get("type") == "feat":
-                main_commit = c.copy()
-                break
-
-        details = []
-        for c in group_commits:
-            details.append(clean_commit_message(c.get("message", "")))
-
-        # 去重并保持顺序
-        seen = set()
-        uniq_details = []
-        for d in details:
-            key = d.strip()
-            if not key or key in seen:
-                continue
-            seen.add(key)
-            uniq_details.append(d.strip())
+    for group, positions in enumerate(members):
+        main_commit = commits[mains[group]].copy()
+        group_commits = [commits[i] for i in positions]
 
+        uniq_details = list(dict.fromkeys(
+            detail for detail in (clean_commit_message(c.get("message", "")) for c in group_commits) if detail
+        ))
         main_commit["details"] = uniq_details if len(uniq_details) > 1 else []
+
+        if across_projects:
+            projects = list(dict.fromkeys(c["project"] for c in group_commits if c.get("project")))
+            if len(projects) > 1:
+                main_commit["projects"] = projects
+        if len(group_commits) > 1 and any("lines" in c for c in group_commits):
+            _sum_diff_stats(main_commit, group_commits)
         merged.append(main_commit)
 
     return merged
 
 
-def extract_keywords(message: str) -> List[str]:
+def _sum_diff_stats(target: Dict[str, Any], commits: List[Dict[str, Any]]) -> None:
+    """把一组提交的 diff 统计汇总到 target"""
+    for field in ("insertions", "deletions", "lines"):
+        target[field] = sum(c.get(field, 0) for c in commits)
+    files: Dict[str, None] = {}
+    for c in commits:
+        files.update(dict.fromkeys(c.get("files", [])))
+    target["files"] = list(files)
+
+
+def format_diff_stats(commit: Dict[str, Any]) -> str:
+    """格式化改动规模，如 "+120/-30，5 个文件"；没有统计时返回空字符串"""
+    if "lines" not in commit:
+        return ""
+    return f"+{commit.get('insertions', 0)}/-{commit.get('deletions', 0)}，{len(commit.get('files', []))} 个文件"
+
+
+def extract_keywords(message: str, drop_generic: bool = False) -> List[str]:
     """从提交信息中提取关键词
 
     Args:
         message: 提交信息
+        drop_generic: 是否同时去掉 GENERIC_KEYWORDS 中的泛用词
 
     Returns:
         关键词列表
@@ -156,6 +260,8 @@ def extract_keywords(message: str) -> List[str]:
     # 过滤常见无意义词
     stop_words = {"the", "and", "for", "with", "this", "that", "from", "into"}
     keywords = [k for k in keywords if k.lower() not in stop_words]
+    if drop_generic:
+        keywords = [k for k in keywords if k not in GENERIC_KEYWORDS]
 
     return keywords[:3]  # 只保留前3个关键词
 
@@ -168,12 +274,14 @@ def clean_commit_message(message: str) -> str:
 def format_project_section(
     project: str,
     commits: List[Dict[str, Any]],
+    show_stats: bool = False,
 ) -> str:
     """格式化项目部分
 
     Args:
         project: 项目名称
         commits: 提交记录列表
+        show_stats: 是否在工作点后附上改动规模
 
     Returns:
         格式化的 Markdown 内容
@@ -182,7 +290,8 @@ def format_project_section(
 
     for commit in commits:
         summary = summarize_commit(commit["message"])
-        lines.append(f"  - {summary}")
+        stats = format_diff_stats(commit) if show_stats else ""
+        lines.append(f"  - {summary}（{stats}）" if stats else f"  - {summary}")
         details = commit.get("details") or []
         for detail in details:
             lines.append(f"    - {detail}")
@@ -230,6 +339,9 @@ def generate_full_report(
     commits_by_project: Dict[str, List[Dict[str, Any]]],
     supplements: Optional[List[str]] = None,
     date_range: Optional[str] = None,
+    show_stats: bool = False,
+    merge_across_projects: bool = False,
+    merge_across_weeks: bool = True,
 ) -> str:
     """生成完整周报
 
@@ -237,6 +349,9 @@ def generate_full_report(
         commits_by_project: 按项目分组的提交记录
         supplements: 补充内容列表
         date_range: 日期范围描述
+        show_stats: 是否在工作点后附上改动规模
+        merge_across_projects: 是否跨项目合并相关提交
+        merge_across_weeks: 是否跨周合并相关提交
 
     Returns:
         完整的 Markdown 周报
@@ -247,7 +362,9 @@ def generate_full_report(
         all_commits.extend(commits)
 
     # 生成报告内容
-    content = generate_report(all_commits, supplements)
+    content = generate_report(
+        all_commits, supplements, show_stats, merge_across_projects, merge_across_weeks,
+    )
 
     # 添加标题（如果有日期范围）
     if date_range:
@@ -0,0 +1,242 @@
+"""周报全文检索模块
+
+以报告中的每个条目（主要工作点 + 补充说明）为检索单元建立倒排索引，
+支持按文档增量添加、删除，按 BM25 排序并提取片段。
+
+分词规则：拉丁字母与数字按连续串切分（小写），中文按相邻两字切分（单字保留为一元词）。
+
+索引本身不涉及文件读写，持久化由 storage 模块负责（to_dict / from_dict）。
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+INDEX_VERSION = 1
+
+# BM25 参数
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 主要工作点中的词频权重（补充说明为 1）
+SUMMARY_WEIGHT = 2
+
+# 片段长度（字符），匹配位置前后各保留约一半
+SNIPPET_WIDTH = 60
+
+_LATIN_RE = re.compile(r"[a-z0-9]+")
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """切分检索词
+
+    Args:
+        text: 文本
+
+    Returns:
+        词列表（拉丁词在前，中文二元词在后，保留重复）
+    """
+    text = text.lower()
+    tokens = _LATIN_RE.findall(text)
+    for run in _CJK_RE.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def make_snippet(text: str, terms: Sequence[str], width: int = SNIPPET_WIDTH) -> str:
+    """截取 text 中首个检索词附近的片段，截断处用省略号标出"""
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in terms]
+    positions = [pos for pos in positions if pos >= 0]
+    if len(text) <= width or not positions:
+        return text if len(text) <= width else text[:width] + "…"
+
+    start = max(0, min(positions) - width // 2)
+    end = min(len(text), start + width)
+    start = max(0, end - width)
+    return ("…" if start > 0 else "") + text[start:end] + ("…" if end < len(text) else "")
+
+
+class ReportIndex:
+    """报告条目的倒排索引
+
+    docs: 文档 ID -> {"meta": 报告元数据（kind, start_date, end_date, path 等）, "units": 条目数}
+    units: 条目 ID（"文档 ID#序号"）-> {"doc", "section", "summary", "details", "length"}
+    postings: 词 -> {条目 ID: 加权词频}
+    """
+
+    def __init__(self) -> None:
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.units: Dict[str, Dict[str, Any]] = {}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.total_length = 0
+
+    # ---------- 持久化 ----------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "docs": self.docs,
+            "units": self.units,
+            "postings": self.postings,
+            "total_length": self.total_length,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["ReportIndex"]:
+        """从 to_dict 的结果恢复，版本不符或格式错误时返回 None"""
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        index = cls()
+        try:
+            index.docs = dict(data["docs"])
+            index.units = dict(data["units"])
+            index.postings = dict(data["postings"])
+            index.total_length = int(data["total_length"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return index
+
+    # ---------- 增量更新 ----------
+
+    @staticmethod
+    def _unit_terms(summary: str, details: Sequence[str]) -> Dict[str, int]:
+        weights: Dict[str, int] = {}
+        for term in tokenize(summary):
+            weights[term] = weights.get(term, 0) + SUMMARY_WEIGHT
+        for detail in details:
+            for term in tokenize(detail):
+                weights[term] = weights.get(term, 0) + 1
+        return weights
+
+    def add_document(
+        self,
+        doc_id: str,
+        meta: Dict[str, Any],
+        entries: Sequence[Tuple[str, str, Sequence[str]]],
+    ) -> None:
+        """添加或替换一份报告
+
+        Args:
+            doc_id: 文档 ID
+            meta: 报告元数据，start_date / end_date 为 ISO 日期字符串
+            entries: (分组, 主要工作点, 补充说明列表) 序列
+        """
+        self.remove_document(doc_id)
+
+        for position, (section, summary, details) in enumerate(entries):
+            unit_id = f"{doc_id}#{position}"
+            weights = self._unit_terms(summary, details)
+            length = sum(weights.values())
+            self.units[unit_id] = {
+                "doc": doc_id,
+                "section": section,
+                "summary": summary,
+                "details": list(details),
+                "length": length,
+            }
+            self.total_length += length
+            for term, weight in weights.items():
+                self.postings.setdefault(term, {})[unit_id] = weight
+
+        self.docs[doc_id] = {"meta": dict(meta), "units": len(entries)}
+
+    def remove_document(self, doc_id: str) -> bool:
+        """删除一份报告，返回是否存在"""
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return False
+
+        for position in range(doc["units"]):
+            unit_id = f"{doc_id}#{position}"
+            unit = self.units.pop(unit_id, None)
+            if unit is None:
+                continue
+            self.total_length -= unit["length"]
+            for term in self._unit_terms(unit["summary"], unit["details"]):
+                posting = self.postings.get(term)
+                if posting is None:
+                    continue
+                posting.pop(unit_id, None)
+                if not posting:
+                    del self.postings[term]
+        return True
+
+    # ---------- 检索 ----------
+
+    def search(
+        self,
+        query: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = 20,
+    ) -> List[Dict[str, Any]]:
+        """检索报告条目
+
+        Args:
+            query: 查询文本
+            since: 只返回结束日期不早于该 ISO 日期的报告中的条目
+            until: 只返回开始日期不晚于该 ISO 日期的报告中的条目
+            limit: 最多返回条数，None 表示不限制
+
+        Returns:
+            按得分降序（同分时较新的报告在前）的结果列表，每项包含报告元数据、
+            section, summary, details, snippet, score
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.units:
+            return []
+
+        total = len(self.units)
+        average_length = self.total_length / total if total else 0.0
+        scores: Dict[str, float] = {}
+        for term in terms:
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            for unit_id, tf in posting.items():
+                length = self.units[unit_id]["length"]
+                norm = 1 - BM25_B + BM25_B * length / average_length if average_length else 1.0
+                scores[unit_id] = scores.get(unit_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+
+        hits = []
+        for unit_id, score in scores.items():
+            unit = self.units[unit_id]
+            meta = self.docs[unit["doc"]]["meta"]
+            if since and meta.get("end_date") and meta["end_date"] < since:
+                continue
+            if until and meta.get("start_date") and meta["start_date"] > until:
+                continue
+            hits.append((score, meta.get("end_date") or "", unit_id))
+
+        # 稳定排序：得分降序，其次报告结束日期降序，最后按条目 ID
+        hits.sort(key=lambda hit: hit[2])
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        if limit is not None:
+            hits = hits[:limit]
+
+        results = []
+        for score, _, unit_id in hits:
+            unit = self.units[unit_id]
+            lines = [unit["summary"]] + unit["details"]
+            # 片段取自命中检索词最多的一行
+            best_line = max(lines, key=lambda line: sum(term in line.lower() for term in terms))
+            results.append({
+                **self.docs[unit["doc"]]["meta"],
+                "section": unit["section"],
+                "summary": unit["summary"],
+                "details": list(unit["details"]),
+                "snippet": make_snippet(best_line, terms),
+                "score": round(score, 4),
+            })
+        return results
+
@@ -1,14 +1,51 @@
 """存储管理模块
 
 管理周报的存储和检索。
+
+存储目录下的 catalog.json 记录全部周报与时间段报告，由保存、删除函数在
+锁内更新；列表与索引生成只读目录清单，不再遍历全部报告文件。清单同时记录
+各年份目录与 periods 目录的 mtime，发现外部改动（手工增删文件）时自动重建。
+
+search-index.json 是报告条目的全文检索索引（见 report_index），随保存、删除
+增量更新，search_reports 检索前会按清单补齐缺失或多余的报告。
+
+每份报告旁有一个结构化副本（.week-03.md.json，见 ReportState），保存同一周
+（时间段）的新内容时只解析新内容并追加缺少的条目，没有新增内容时不写任何文件。
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import secrets
+import stat
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.report_index import ReportIndex
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# 报告目录清单
+CATALOG_FILENAME = "catalog.json"
+CATALOG_LOCK_FILENAME = "catalog.lock"
+CATALOG_VERSION = 1
+
+# 全文检索索引；进程内按文件 mtime 缓存已解析的索引
+SEARCH_INDEX_FILENAME = "search-index.json"
+_SEARCH_INDEX_CACHE: Dict[str, tuple[int, ReportIndex]] = {}
+
+# 同一进程内的清单更新互斥；跨进程由 catalog.lock 上的 flock 保证
+_CATALOG_LOCK = threading.Lock()
 
 
 @dataclass
@@ -77,37 +114,53 @@ def _dedupe_preserve_order(items: List[str]) -> List[str]:
     return result
 
 
-def _merge_sections(
-    existing: dict[str, list[ReportEntry]],
+def _normalize_sections(sections: dict[str, list[ReportEntry]]) -> dict[str, list[ReportEntry]]:
+    """复制各条目并去重补充说明（合并结果中的补充说明均已去重）"""
+    return {
+        section: [ReportEntry(e.summary, _dedupe_preserve_order(e.details)) for e in entries]
+        for section, entries in sections.items()
+    }
+
+
+def _merge_into(
+    merged: dict[str, list[ReportEntry]],
     new: dict[str, list[ReportEntry]],
-) -> dict[str, list[ReportEntry]]:
-    merged: dict[str, list[ReportEntry]] = {}
+) -> bool:
+    """把新内容原地合并进已去重的 merged，只追加缺少的条目和补充说明
 
-    # 保留已有 section 的顺序
-    for section, entries in existing.items():
-        merged[section] = [ReportEntry(e.summary, list(e.details)) for e in entries]
+    Returns:
+        merged 是否有改动
+    """
+    changed = False
 
-    # 合并新内容
     for section, entries in new.items():
         if section not in merged:
-            merged[section] = [ReportEntry(e.summary, list(e.details)) for e in entries]
+            # 保留已有 section 的顺序，新 section 追加在末尾
+            merged[section] = [ReportEntry(e.summary, _dedupe_preserve_order(e.details)) for e in entries]
+            changed = True
             continue
 
-        by_summary: dict[str, ReportEntry] = {e.summary: e for e in merged[section]}
+        targets = merged[section]
+        by_summary: dict[str, ReportEntry] = {e.summary: e for e in targets}
+        known: dict[str, set[str]] = {}
         for entry in entries:
-            if entry.summary in by_summary:
-                target = by_summary[entry.summary]
-                target.details = _dedupe_preserve_order(target.details + entry.details)
-            else:
-                merged[section].append(ReportEntry(entry.summary, list(entry.details)))
-                by_summary[entry.summary] = merged[section][-1]
-
-    # 统一去重
-    for section, entries in merged.items():
-        for entry in entries:
-            entry.details = _dedupe_preserve_order(entry.details)
+            target = by_summary.get(entry.summary)
+            if target is None:
+                target = ReportEntry(entry.summary, _dedupe_preserve_order(entry.details))
+                targets.append(target)
+                by_summary[entry.summary] = target
+                changed = True
+                continue
+
+            seen = known.setdefault(entry.summary, set(target.details))
+            for detail in entry.details:
+                key = detail.strip()
+                if key and key not in seen:
+                    seen.add(key)
+                    target.details.append(key)
+                    changed = True
 
-    return merged
+    return changed
 
 
 def _render_report_markdown(
@@ -139,10 +192,153 @@ def merge_report_content(existing: str, new: str) -> str:
     new_preamble, new_sections = _parse_report_markdown(new)
 
     preamble = existing_preamble or new_preamble
-    merged_sections = _merge_sections(existing_sections, new_sections)
+    merged_sections = _normalize_sections(existing_sections)
+    _merge_into(merged_sections, new_sections)
     return _render_report_markdown(preamble, merged_sections)
 
 
+# ==================== 增量合并 ====================
+
+# 报告旁的结构化副本（.week-03.md.json），记录合并后的分组与条目
+REPORT_STATE_VERSION = 1
+
+# 副本中保留的最近已合并输入摘要数
+REPORT_STATE_MAX_INPUTS = 32
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_report_state_path(report_path: Path) -> Path:
+    """获取报告的结构化副本路径（同目录的隐藏 JSON 文件）"""
+    return report_path.with_name(f".{report_path.name}.json")
+
+
+@dataclass
+class ReportState:
+    """报告的结构化副本
+
+    report_sha256: 写入副本时报告文件内容的摘要，不一致说明报告被手工修改，副本作废
+    inputs: 最近已合并过的生成内容摘要，再次收到相同内容时无需解析
+    """
+
+    preamble: List[str]
+    sections: Dict[str, List[ReportEntry]]
+    report_sha256: str
+    inputs: List[str]
+
+    @classmethod
+    def from_content(cls, content: str) -> "ReportState":
+        preamble, sections = _parse_report_markdown(content)
+        return cls(preamble, _normalize_sections(sections), _sha256(content), [])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": REPORT_STATE_VERSION,
+            "report_sha256": self.report_sha256,
+            "inputs": self.inputs[-REPORT_STATE_MAX_INPUTS:],
+            "preamble": self.preamble,
+            "sections": {
+                section: [[e.summary, e.details] for e in entries]
+                for section, entries in self.sections.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["ReportState"]:
+        if not isinstance(data, dict) or data.get("version") != REPORT_STATE_VERSION:
+            return None
+        try:
+            sections = {
+                str(section): [ReportEntry(str(summary), [str(d) for d in details]) for summary, details in entries]
+                for section, entries in data["sections"].items()
+            }
+            return cls(
+                preamble=[str(line) for line in data["preamble"]],
+                sections=sections,
+                report_sha256=str(data["report_sha256"]),
+                inputs=[str(digest) for digest in data["inputs"]],
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+
+def _load_report_state(report_path: Path, current: str) -> Optional[ReportState]:
+    """读取结构化副本，缺失、损坏或与报告当前内容不符时返回 None"""
+    try:
+        data = json.loads(get_report_state_path(report_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    state = ReportState.from_dict(data)
+    if state is None or state.report_sha256 != _sha256(current):
+        return None
+    return state
+
+
+def _save_report_state(report_path: Path, state: ReportState) -> None:
+    try:
+        write_text_atomic(get_report_state_path(report_path), json.dumps(state.to_dict(), ensure_ascii=False))
+    except OSError:
+        # 副本只是加速手段，写失败时下次按报告内容重建
+        pass
+
+
+def _write_merged_report(path: Path, content: str) -> Optional[str]:
+    """把新生成的内容合并进报告文件（调用方持有清单锁）
+
+    已有报告时只解析新内容，按结构化副本追加缺少的条目与补充说明；
+    没有新增内容时不写任何文件。
+
+    Args:
+        path: 报告文件路径
+        content: 新生成的报告内容
+
+    Returns:
+        写入后的报告内容，未改动时返回 None
+    """
+    digest = _sha256(content)
+
+    if not path.exists():
+        final = content if content.endswith("\n") else content + "\n"
+        write_text_atomic(path, final)
+        state = ReportState.from_content(final)
+        state.inputs.append(digest)
+        _save_report_state(path, state)
+        return final
+
+    current = path.read_text(encoding="utf-8")
+    state = _load_report_state(path, current)
+    rebuilt = state is None
+    if state is None:
+        # 首次合并或报告被手工修改：按报告内容重建副本
+        state = ReportState.from_content(current)
+
+    changed = False
+    if digest not in state.inputs:
+        new_preamble, new_sections = _parse_report_markdown(content)
+        if not state.preamble and new_preamble:
+            state.preamble = new_preamble
+            changed = True
+        changed = _merge_into(state.sections, new_sections) or changed
+
+    if not changed:
+        if rebuilt:
+            _save_report_state(path, state)
+        return None
+
+    final = _render_report_markdown(state.preamble, state.sections)
+    write_text_atomic(path, final)
+    state.report_sha256 = _sha256(final)
+    state.inputs.append(digest)
+    _save_report_state(path, state)
+    return final
+
+
+def _remove_report_state(report_path: Path) -> None:
+    get_report_state_path(report_path).unlink(missing_ok=True)
+
+
 def get_storage_dir(base_dir: Optional[Path] = None) -> Path:
     """获取存储目录
 
@@ -177,6 +373,225 @@ def get_report_path(
     return storage_dir / str(year) / f"week-{week:02d}.md"
 
 
+# ==================== 目录清单 ====================
+
+
+def _create_temp_file(path: Path) -> Tuple[int, str]:
+    """在目标文件同目录独占创建临时文件
+
+    以 0o666 创建，由系统按当前 umask 裁剪，权限与 open() 新建文件一致。
+
+    Returns:
+        (文件描述符, 临时文件路径)
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_name, flags, 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """原子写入文本文件（写同目录临时文件后替换）
+
+    新文件的权限按 umask 设置，与直接写入时一致；替换已有文件时沿用原文件的权限。
+
+    Args:
+        path: 目标文件路径
+        content: 文件内容
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    fd, tmp_name = _create_temp_file(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def get_catalog_path(base_dir: Optional[Path] = None) -> Path:
+    """获取目录清单文件路径
+
+    Args:
+        base_dir: 存储基础目录
+
+    Returns:
+        目录清单文件路径
+    """
+    return get_storage_dir(base_dir) / CATALOG_FILENAME
+
+
+def _weekly_key(year: int, week: int) -> str:
+    return f"{year}-W{week:02d}"
+
+
+def _weekly_entry(year: int, week: int, filename: str) -> Dict[str, Any]:
+    return {"year": year, "week": week, "filename": filename}
+
+
+def _period_entry(start_date: date, end_date: date, filename: str) -> Dict[str, Any]:
+    return {"start_date": start_date.isoformat(), "end_date": end_date.isoformat(), "filename": filename}
+
+
+def _dir_stamps(storage_dir: Path) -> Dict[str, Optional[int]]:
+    """各年份目录与 periods 目录的 mtime，用于发现清单之外的改动（只 stat 目录，不遍历文件）"""
+    stamps: Dict[str, Optional[int]] = {}
+    try:
+        children = list(os.scandir(storage_dir))
+    except OSError:
+        return stamps
+
+    for child in children:
+        if (child.name.isdigit() or child.name == "periods") and child.is_dir():
+            try:
+                stamps[child.name] = child.stat().st_mtime_ns
+            except OSError:
+                stamps[child.name] = None
+    return stamps
+
+
+def _scan_catalog(storage_dir: Path) -> Dict[str, Any]:
+    """遍历存储目录构建清单（清单缺失、损坏或目录被外部修改时使用）"""
+    weekly: Dict[str, Dict[str, Any]] = {}
+    periods: Dict[str, Dict[str, Any]] = {}
+
+    if storage_dir.exists():
+        # 遍历年份目录
+        for year_dir in storage_dir.iterdir():
+            if not year_dir.is_dir() or not year_dir.name.isdigit():
+                continue
+
+            year = int(year_dir.name)
+
+            # 遍历周报文件
+            for report_file in year_dir.glob("week-*.md"):
+                # 从文件名提取周数
+                week_str = report_file.stem.replace("week-", "")
+                try:
+                    week = int(week_str)
+                except ValueError:
+                    continue
+                weekly[_weekly_key(year, week)] = _weekly_entry(year, week, report_file.name)
+
+        # 遍历时间段报告文件
+        periods_dir = storage_dir / "periods"
+        if periods_dir.exists():
+            for report_file in periods_dir.glob("*_to_*.md"):
+                # 从文件名提取日期范围
+                parts = report_file.stem.split("_to_")  # e.g., "2025-07-13_to_2026-01-13"
+                if len(parts) != 2:
+                    continue
+                try:
+                    start_date = date.fromisoformat(parts[0])
+                    end_date = date.fromisoformat(parts[1])
+                except ValueError:
+                    continue
+                periods[report_file.stem] = _period_entry(start_date, end_date, report_file.name)
+
+    return {"weekly": weekly, "periods": periods}
+
+
+def _read_catalog(storage_dir: Path) -> Optional[Dict[str, Any]]:
+    """读取清单，缺失、损坏、版本不符或目录被外部修改时返回 None"""
+    try:
+        data = json.loads((storage_dir / CATALOG_FILENAME).read_text(encoding="utf-8"))
+        if data.get("version") != CATALOG_VERSION:
+            return None
+        if data.get("stamps") != _dir_stamps(storage_dir):
+            return None
+        return {"weekly": dict(data["weekly"]), "periods": dict(data["periods"])}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_catalog(storage_dir: Path, catalog: Dict[str, Any]) -> None:
+    payload = {
+        "version": CATALOG_VERSION,
+        "stamps": _dir_stamps(storage_dir),
+        "weekly": catalog["weekly"],
+        "periods": catalog["periods"],
+    }
+    write_text_atomic(storage_dir / CATALOG_FILENAME, json.dumps(payload, ensure_ascii=False, indent=1))
+
+
+@contextmanager
+def _catalog_lock(storage_dir: Path) -> Iterator[None]:
+    """进程内线程锁 + 跨进程文件锁"""
+    with _CATALOG_LOCK:
+        if fcntl is None:
+            yield
+            return
+        storage_dir.mkdir(parents=True, exist_ok=True)
+        with open(storage_dir / CATALOG_LOCK_FILENAME, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+@contextmanager
+def _catalog_transaction(base_dir: Optional[Path] = None) -> Iterator[Dict[str, Any]]:
+    """在锁内读取清单，执行文件改动后写回（连同最新的目录 mtime），无变化时跳过
+
+    块内抛出异常时不写回清单，下次读取会因目录 mtime 变化而重建。
+    """
+    storage_dir = get_storage_dir(base_dir)
+    with _catalog_lock(storage_dir):
+        loaded = _read_catalog(storage_dir)
+        catalog = loaded or _scan_catalog(storage_dir)
+        snapshot = {kind: dict(entries) for kind, entries in catalog.items()}
+        stamps = _dir_stamps(storage_dir)
+        yield catalog
+        # 清单与目录都没有变化时（例如报告内容无新增）不重写清单
+        if loaded is not None and catalog == snapshot and _dir_stamps(storage_dir) == stamps:
+            return
+        _write_catalog(storage_dir, catalog)
+
+
+def load_catalog(base_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """读取目录清单，必要时重建
+
+    Args:
+        base_dir: 存储基础目录
+
+    Returns:
+        {"weekly": {"YYYY-Www": {year, week, filename}},
+         "periods": {"起始_to_结束": {start_date, end_date, filename}}}
+    """
+    storage_dir = get_storage_dir(base_dir)
+    catalog = _read_catalog(storage_dir)
+    if catalog is not None:
+        return catalog
+    return rebuild_catalog(base_dir)
+
+
+def rebuild_catalog(base_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """遍历存储目录重建目录清单
+
+    Args:
+        base_dir: 存储基础目录
+
+    Returns:
+        重建后的清单
+    """
+    storage_dir = get_storage_dir(base_dir)
+    with _catalog_lock(storage_dir):
+        catalog = _scan_catalog(storage_dir)
+        _write_catalog(storage_dir, catalog)
+    return catalog
+
+
 def save_report(
     content: str,
     year: int,
@@ -196,16 +611,14 @@ def save_report(
     """
     path = get_report_path(year, week, base_dir)
 
-    # 确保目录存在
-    path.parent.mkdir(parents=True, exist_ok=True)
+    with _catalog_transaction(base_dir) as catalog:
+        # 同一周多次生成时进行内容合并，无新增内容时不写文件
+        final = _write_merged_report(path, content)
 
-    # 同一周多次生成时进行内容合并
-    if path.exists():
-        existing = path.read_text(encoding="utf-8")
-        merged = merge_report_content(existing, content)
-        path.write_text(merged, encoding="utf-8")
-    else:
-        path.write_text(content if content.endswith("\n") else content + "\n", encoding="utf-8")
+        entry = _weekly_entry(year, week, path.name)
+        catalog["weekly"][_weekly_key(year, week)] = entry
+        if final is not None:
+            _update_search_index(get_storage_dir(base_dir), _weekly_key(year, week), _weekly_meta(entry), final)
 
     return path
 
@@ -217,37 +630,26 @@ def list_reports(base_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
         base_dir: 存储基础目录
 
     Returns:
-        周报列表，每项包含 year, week, path
+        周报列表，每项包含 year, week, path, filename（按年份、周数倒序）
     """
     storage_dir = get_storage_dir(base_dir)
-
     if not storage_dir.exists():
         return []
 
+    catalog = load_catalog(base_dir)
+    year_dirs: Dict[int, Path] = {}
     reports = []
-
-    # 遍历年份目录
-    for year_dir in sorted(storage_dir.iterdir(), reverse=True):
-        if not year_dir.is_dir() or not year_dir.name.isdigit():
-            continue
-
-        year = int(year_dir.name)
-
-        # 遍历周报文件
-        for report_file in sorted(year_dir.glob("week-*.md"), reverse=True):
-            # 从文件名提取周数
-            week_str = report_file.stem.replace("week-", "")
-            try:
-                week = int(week_str)
-            except ValueError:
-                continue
-
-            reports.append({
-                "year": year,
-                "week": week,
-                "path": report_file,
-                "filename": report_file.name,
-            })
+    for key in sorted(catalog["weekly"], reverse=True):
+        entry = catalog["weekly"][key]
+        year = entry["year"]
+        if year not in year_dirs:
+            year_dirs[year] = storage_dir / str(year)
+        reports.append({
+            "year": year,
+            "week": entry["week"],
+            "path": year_dirs[year] / entry["filename"],
+            "filename": entry["filename"],
+        })
 
     return reports
 
@@ -283,6 +685,8 @@ def get_report_by_week(
 def update_index(base_dir: Optional[Path] = None) -> None:
     """更新周报索引文件
 
+    索引内容由目录清单生成；与现有 index.md 相同时不重写。
+
     Args:
         base_dir: 存储基础目录
     """
@@ -315,7 +719,13 @@ def update_index(base_dir: Optional[Path] = None) -> None:
 
     # 写入索引文件
     index_path = storage_dir / "index.md"
-    index_path.write_text("\n".join(lines), encoding="utf-8")
+    content = "\n".join(lines)
+    try:
+        if index_path.read_text(encoding="utf-8") == content:
+            return
+    except OSError:
+        pass
+    write_text_atomic(index_path, content)
 
 
 def delete_report(
@@ -335,10 +745,15 @@ def delete_report(
     """
     path = get_report_path(year, week, base_dir)
 
-    if not path.exists():
-        return False
+    with _catalog_transaction(base_dir) as catalog:
+        if not path.exists():
+            catalog["weekly"].pop(_weekly_key(year, week), None)
+            return False
 
-    path.unlink()
+        path.unlink()
+        _remove_report_state(path)
+        catalog["weekly"].pop(_weekly_key(year, week), None)
+        _update_search_index(get_storage_dir(base_dir), _weekly_key(year, week), None, None)
     return True
 
 
@@ -384,16 +799,14 @@ def save_period_report(
     """
     path = get_period_report_path(start_date, end_date, base_dir)
 
-    # 确保目录存在
-    path.parent.mkdir(parents=True, exist_ok=True)
+    with _catalog_transaction(base_dir) as catalog:
+        # 同一时间段多次生成时进行内容合并，无新增内容时不写文件
+        final = _write_merged_report(path, content)
 
-    # 同一时间段多次生成时进行内容合并
-    if path.exists():
-        existing = path.read_text(encoding="utf-8")
-        merged = merge_report_content(existing, content)
-        path.write_text(merged, encoding="utf-8")
-    else:
-        path.write_text(content if content.endswith("\n") else content + "\n", encoding="utf-8")
+        entry = _period_entry(start_date, end_date, path.name)
+        catalog["periods"][path.stem] = entry
+        if final is not None:
+            _update_search_index(get_storage_dir(base_dir), path.stem, _period_meta(entry), final)
 
     return path
 
@@ -408,32 +821,19 @@ def list_period_reports(base_dir: Optional[Path] = None) -> List[Dict[str, Any]]
         时间段报告列表，每项包含 start_date, end_date, path, filename
     """
     storage_dir = get_storage_dir(base_dir)
-    periods_dir = storage_dir / "periods"
-
-    if not periods_dir.exists():
+    if not storage_dir.exists():
         return []
 
+    catalog = load_catalog(base_dir)
+    periods_dir = storage_dir / "periods"
     reports = []
-
-    # 遍历时间段报告文件
-    for report_file in sorted(periods_dir.glob("*_to_*.md"), reverse=True):
-        # 从文件名提取日期范围
-        stem = report_file.stem  # e.g., "2025-07-13_to_2026-01-13"
-        parts = stem.split("_to_")
-        if len(parts) != 2:
-            continue
-
-        try:
-            start_date = date.fromisoformat(parts[0])
-            end_date = date.fromisoformat(parts[1])
-        except ValueError:
-            continue
-
+    for key in sorted(catalog["periods"], reverse=True):
+        entry = catalog["periods"][key]
         reports.append({
-            "start_date": start_date,
-            "end_date": end_date,
-            "path": report_file,
-            "filename": report_file.name,
+            "start_date": date.fromisoformat(entry["start_date"]),
+            "end_date": date.fromisoformat(entry["end_date"]),
+            "path": periods_dir / entry["filename"],
+            "filename": entry["filename"],
         })
 
     return reports
@@ -484,8 +884,191 @@ def delete_period_report(
     """
     path = get_period_report_path(start_date, end_date, base_dir)
 
-    if not path.exists():
-        return False
+    with _catalog_transaction(base_dir) as catalog:
+        if not path.exists():
+            catalog["periods"].pop(path.stem, None)
+            return False
 
-    path.unlink()
+        path.unlink()
+        _remove_report_state(path)
+        catalog["periods"].pop(path.stem, None)
+        _update_search_index(get_storage_dir(base_dir), path.stem, None, None)
     return True
+
+
+# ==================== 全文检索 ====================
+
+
+def _weekly_meta(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """周报的检索元数据（ISO 周的周一到周日）"""
+    meta: Dict[str, Any] = {
+        "kind": "weekly",
+        "year": entry["year"],
+        "week": entry["week"],
+        "path": f"{entry['year']}/{entry['filename']}",
+    }
+    try:
+        monday = date.fromisocalendar(entry["year"], entry["week"], 1)
+    except ValueError:
+        return meta
+    meta["start_date"] = monday.isoformat()
+    meta["end_date"] = (monday + timedelta(days=6)).isoformat()
+    return meta
+
+
+def _period_meta(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """时间段报告的检索元数据"""
+    return {
+        "kind": "period",
+        "start_date": entry["start_date"],
+        "end_date": entry["end_date"],
+        "path": f"periods/{entry['filename']}",
+    }
+
+
+def _report_entries(content: str) -> List[tuple[str, str, List[str]]]:
+    """把报告内容拆成 (分组, 主要工作点, 补充说明) 条目"""
+    _, sections = _parse_report_markdown(content)
+    return [
+        (section, entry.summary, entry.details)
+        for section, entries in sections.items()
+        for entry in entries
+    ]
+
+
+def _load_search_index(storage_dir: Path) -> Optional[ReportIndex]:
+    path = storage_dir / SEARCH_INDEX_FILENAME
+    try:
+        mtime = path.stat().st_mtime_ns
+        cached = _SEARCH_INDEX_CACHE.get(str(path))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        index = ReportIndex.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return None
+    if index is not None:
+        _SEARCH_INDEX_CACHE[str(path)] = (mtime, index)
+    return index
+
+
+def _save_search_index(storage_dir: Path, index: ReportIndex) -> None:
+    path = storage_dir / SEARCH_INDEX_FILENAME
+    _SEARCH_INDEX_CACHE.pop(str(path), None)
+    write_text_atomic(path, json.dumps(index.to_dict(), ensure_ascii=False))
+    _SEARCH_INDEX_CACHE[str(path)] = (path.stat().st_mtime_ns, index)
+
+
+def _update_search_index(
+    storage_dir: Path,
+    doc_id: str,
+    meta: Optional[Dict[str, Any]],
+    content: Optional[str],
+) -> None:
+    """在清单锁内增量更新检索索引：meta/content 为 None 表示删除该报告
+
+    索引不存在时跳过，留给 search_reports 按清单一次性补齐。
+    """
+    index = _load_search_index(storage_dir)
+    if index is None:
+        return
+    if meta is None or content is None:
+        if not index.remove_document(doc_id):
+            return
+    else:
+        index.add_document(doc_id, meta, _report_entries(content))
+    _save_search_index(storage_dir, index)
+
+
+def _sync_search_index(storage_dir: Path, catalog: Dict[str, Any], index: ReportIndex) -> bool:
+    """让索引与清单一致：补充未索引的报告、移除已不存在的报告，返回是否有改动"""
+    expected: Dict[str, Dict[str, Any]] = {}
+    for key, entry in catalog["weekly"].items():
+        expected[key] = _weekly_meta(entry)
+    for key, entry in catalog["periods"].items():
+        expected[key] = _period_meta(entry)
+
+    changed = False
+    for doc_id in [doc_id for doc_id in index.docs if doc_id not in expected]:
+        index.remove_document(doc_id)
+        changed = True
+
+    for doc_id, meta in expected.items():
+        if doc_id in index.docs:
+            continue
+        try:
+            content = (storage_dir / meta["path"]).read_text(encoding="utf-8")
+        except OSError:
+            continue
+        index.add_document(doc_id, meta, _report_entries(content))
+        changed = True
+
+    return changed
+
+
+def _as_iso(value: Union[date, str, None]) -> Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def search_reports(
+    query: str,
+    since: Union[date, str, None] = None,
+    until: Union[date, str, None] = None,
+    limit: Optional[int] = 20,
+    base_dir: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """全文检索历史周报与时间段报告
+
+    以报告中的每个条目（主要工作点 + 补充说明）为单位，按 BM25 排序；
+    中文按二元词、英文按单词匹配。
+
+    Args:
+        query: 查询文本，如 "上线 支付"
+        since: 只检索结束日期不早于该日期的报告
+        until: 只检索开始日期不晚于该日期的报告
+        limit: 最多返回条数，None 表示不限制
+        base_dir: 存储基础目录
+
+    Returns:
+        结果列表，每项包含 kind（weekly/period）、start_date, end_date, path、
+        周报的 year/week，以及 section, summary, details, snippet, score
+    """
+    storage_dir = get_storage_dir(base_dir)
+    if not storage_dir.exists():
+        return []
+
+    with _catalog_lock(storage_dir):
+        catalog = _read_catalog(storage_dir)
+        if catalog is None:
+            catalog = _scan_catalog(storage_dir)
+            _write_catalog(storage_dir, catalog)
+        index = _load_search_index(storage_dir) or ReportIndex()
+        if _sync_search_index(storage_dir, catalog, index) or not (storage_dir / SEARCH_INDEX_FILENAME).exists():
+            _save_search_index(storage_dir, index)
+
+    results = index.search(query, since=_as_iso(since), until=_as_iso(until), limit=limit)
+    for result in results:
+        for field in ("start_date", "end_date"):
+            if result.get(field):
+                result[field] = date.fromisoformat(result[field])
+        result["path"] = storage_dir / result["path"]
+    return results
+
+
+def rebuild_search_index(base_dir: Optional[Path] = None) -> int:
+    """丢弃并重建全文检索索引（手工修改了报告内容时使用）
+
+    Args:
+        base_dir: 存储基础目录
+
+    Returns:
+        已索引的报告数
+    """
+    storage_dir = get_storage_dir(base_dir)
+    catalog = load_catalog(base_dir)
+    index = ReportIndex()
+    with _catalog_lock(storage_dir):
+        _sync_search_index(storage_dir, catalog, index)
+        _save_search_index(storage_dir, index)
+    return len(index.docs)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""git_analyzer 的配置读取与身份缓存测试"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR))
+
+from src.config_manager import load_config  # noqa: E402
+from src.git_analyzer import get_all_commits_from_config, get_git_identity  # noqa: E402
+
+AUTHOR = "Report Test"
+START_DATE = date(2000, 1, 1)
+END_DATE = date(2100, 1, 1)
+
+
+class ConfigCollectionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.repo = self.root / "project-a"
+        self.repo.mkdir()
+        self.git("init")
+        self.git("config", "user.name", AUTHOR)
+        self.git("config", "user.email", "report@example.com")
+        for message in ("feat: add login", "chore(deps): bump requests"):
+            self.git("commit", "--allow-empty", "-m", message)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def git(self, *args: str) -> None:
+        subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+
+    def collect(self, **settings) -> dict:
+        config_path = self.root / "config.json"
+        config = {"repos": [{"name": "project-a", "path": str(self.repo)}], "commit_cache": False, **settings}
+        config_path.write_text(json.dumps(config), encoding="utf-8")
+        commits = get_all_commits_from_config(START_DATE, END_DATE, AUTHOR, config=load_config(config_path))
+        return {commit["message"]: commit["is_trivial"] for commit in commits["project-a"]}
+
+    def test_builtin_rules_without_trivial_patterns(self) -> None:
+        self.assertEqual(
+            self.collect(),
+            {"feat: add login": False, "chore(deps): bump requests": False},
+        )
+
+    def test_trivial_patterns_from_config(self) -> None:
+        self.assertEqual(
+            self.collect(trivial_patterns=[r"^chore\(deps\)"]),
+            {"feat: add login": False, "chore(deps): bump requests": True},
+        )
+
+
+class IdentityCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.repo = self.root / "project-a"
+        self.repo.mkdir()
+        subprocess.run(["git", "init"], cwd=self.repo, check=True, capture_output=True)
+        subprocess.run(["git", "config", "user.name", AUTHOR], cwd=self.repo, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "config", "user.email", "report@example.com"],
+            cwd=self.repo,
+            check=True,
+            capture_output=True,
+        )
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_malformed_cache_entry_falls_back_to_git_config(self) -> None:
+        cache_path = self.root / "identity-cache.json"
+        cache_path.write_text(
+            json.dumps({"version": 1, "repos": {str(self.repo.resolve()): {"name": "x"}}}),
+            encoding="utf-8",
+        )
+
+        identity = get_git_identity(self.repo, cache_path=cache_path)
+
+        self.assertEqual(identity, {"name": AUTHOR, "email": "report@example.com"})
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))["repos"][str(self.repo.resolve())]
+        self.assertIn("files", cached)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""storage 原子写入测试"""
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR))
+
+from src.storage import write_text_atomic  # noqa: E402
+
+
+@unittest.skipIf(os.name == "nt", "POSIX 权限位")
+class WriteTextAtomicTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.old_umask = os.umask(0o027)
+
+    def tearDown(self) -> None:
+        os.umask(self.old_umask)
+        self.temp_dir.cleanup()
+
+    def mode(self, path: Path) -> int:
+        return stat.S_IMODE(path.stat().st_mode)
+
+    def test_new_file_follows_current_umask(self) -> None:
+        path = self.root / "reports" / "week-03.md"
+
+        write_text_atomic(path, "first\n")
+
+        self.assertEqual(self.mode(path), 0o640)
+        self.assertEqual(path.read_text(encoding="utf-8"), "first\n")
+
+    def test_rewrite_keeps_existing_mode(self) -> None:
+        path = self.root / "week-03.md"
+        path.write_text("first\n", encoding="utf-8")
+        path.chmod(0o604)
+
+        write_text_atomic(path, "second\n")
+
+        self.assertEqual(self.mode(path), 0o604)
+        self.assertEqual(path.read_text(encoding="utf-8"), "second\n")
+        self.assertEqual([p.name for p in self.root.iterdir()], ["week-03.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()